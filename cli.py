@@ -1,9 +1,9 @@
 """March Madness Bracket Optimizer - CLI entry point.
 
 Usage:
-    python cli.py fetch-ratings [--source consensus|torvik|kenpom|espn|paine|draftkings|manual] [--year 2026] [--file path.csv]
+    python cli.py fetch-ratings [--source consensus|torvik|kenpom|espn|paine|draftkings|manual] [--year 2026] [--file path.csv] [--refresh]
     python cli.py load-bracket [--interactive | --file path.json]
-    python cli.py fetch-picks [--source espn|yahoo] [--year 2026] [--challenge-id 277 | --manual path.csv]
+    python cli.py fetch-picks [--source espn|yahoo|both] [--year 2026] [--challenge-id 277 | --manual path.csv] [--refresh]
     python cli.py simulate [--sims 10000]
     python cli.py optimize [--pool-size 7] [--accuracy-weight 0.75] [--force-champion "Duke"]
     python cli.py show
@@ -11,9 +11,9 @@ Usage:
 """
 
 import argparse
+import heapq
 import json
 import os
-import pickle
 import sys
 
 # Add project root to path
@@ -22,26 +22,147 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import config
 from ingestion.ratings_sources import upgrade_loaded_ratings
 from optimizer.pick_utils import filter_pick_pcts_to_teams, normalize_pick_pcts, summarize_pick_coverage
-from optimizer.reach_prob_utils import resolve_reach_probs
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 RAW_DIR = os.path.join(DATA_DIR, "raw")
-STATE_FILE = os.path.join(DATA_DIR, "state.pkl")
+STATE_DIR = os.path.join(DATA_DIR, "state")
+LEGACY_STATE_FILE = os.path.join(DATA_DIR, "state.pkl")
+META_STATE_FILE = os.path.join(STATE_DIR, "meta.json")
+
+# Flat numeric tables are stored as msgpack; model objects still need pickle.
+MSGPACK_STATE_KEYS = ("ratings", "pick_pcts", "reach_probs")
+PICKLE_STATE_KEYS = ("bracket", "optimized")
+
+
+class State(dict):
+    """State dict that remembers which keys changed since it was loaded or saved.
+
+    Reassigning a key to an equal value does not count as a change, so
+    commands can keep writing derived values back unconditionally.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dirty_keys: set[str] = set()
+
+    def __setitem__(self, key, value):
+        if key not in self or self[key] is not value and self[key] != value:
+            self.dirty_keys.add(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.dirty_keys.add(key)
+
+    def pop(self, key, *default):
+        if key in self:
+            self.dirty_keys.add(key)
+        return super().pop(key, *default)
 
 
 def save_state(state: dict):
-    """Save intermediate state to disk."""
-    os.makedirs(DATA_DIR, exist_ok=True)
-    with open(STATE_FILE, "wb") as f:
-        pickle.dump(state, f)
+    """Save intermediate state to disk.
+
+    Each msgpack/pickle key gets its own file under data/state/; any other
+    plain values (e.g. ratings_source) go into meta.json. Keys missing from
+    ``state`` have their files removed so popped entries stay invalidated.
+
+    A ``State`` only rewrites the files for keys it marked dirty, and is a
+    no-op when nothing changed; a plain dict is written in full. Files are
+    written to a temp path and renamed into place so an interrupted save
+    never leaves a truncated cache behind.
+    """
+    dirty = getattr(state, "dirty_keys", None)
+    if dirty is not None and not dirty:
+        return
 
+    import msgpack
+    import pickle
 
-def load_state() -> dict:
+    def changed(key: str) -> bool:
+        return dirty is None or key in dirty
+
+    os.makedirs(STATE_DIR, exist_ok=True)
+
+    for key in MSGPACK_STATE_KEYS:
+        if not changed(key):
+            continue
+        path = os.path.join(STATE_DIR, f"{key}.msgpack")
+        fallback_path = os.path.join(STATE_DIR, f"{key}.pkl")
+        if key in state:
+            value = state[key]
+            if key == "reach_probs":
+                value = _pack_reach_probs(value)
+            try:
+                data = msgpack.packb(value, use_bin_type=True, default=_msgpack_default)
+            except (TypeError, ValueError, OverflowError):
+                # Something msgpack can't represent: keep the key, just pickled.
+                _write_state_file(fallback_path, pickle.dumps(state[key], protocol=pickle.HIGHEST_PROTOCOL))
+                stale = path
+            else:
+                _write_state_file(path, data)
+                stale = fallback_path
+            if os.path.exists(stale):
+                os.remove(stale)
+        else:
+            for stale in (path, fallback_path):
+                if os.path.exists(stale):
+                    os.remove(stale)
+
+    for key in PICKLE_STATE_KEYS:
+        if not changed(key):
+            continue
+        path = os.path.join(STATE_DIR, f"{key}.pkl")
+        if key in state:
+            _write_state_file(path, pickle.dumps(state[key], protocol=pickle.HIGHEST_PROTOCOL))
+        elif os.path.exists(path):
+            os.remove(path)
+
+    meta_keys = [key for key in (dirty if dirty is not None else state)
+                 if key not in MSGPACK_STATE_KEYS and key not in PICKLE_STATE_KEYS]
+    if dirty is None or meta_keys or not os.path.exists(META_STATE_FILE):
+        meta = {
+            key: value
+            for key, value in state.items()
+            if key not in MSGPACK_STATE_KEYS and key not in PICKLE_STATE_KEYS
+        }
+        _write_state_file(META_STATE_FILE, json.dumps(meta, indent=2).encode("utf-8"))
+
+    if dirty is not None:
+        dirty.clear()
+
+
+def _msgpack_default(obj):
+    """Let msgpack store NumPy scalars and arrays as plain Python values."""
+    import numpy as np
+
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Cannot msgpack {type(obj).__name__}")
+
+
+def _write_state_file(path: str, data: bytes):
+    """Write ``data`` to ``path`` atomically via a sibling temp file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def load_state() -> State:
     """Load intermediate state from disk."""
-    if os.path.exists(STATE_FILE):
-        with open(STATE_FILE, "rb") as f:
-            state = pickle.load(f)
+    if os.path.isdir(STATE_DIR):
+        state = State(_read_state_dir())
+    elif os.path.exists(LEGACY_STATE_FILE):
+        state = State(_read_legacy_state_file())
+        # Nothing is in data/state/ yet, so the first save must write every key.
+        state.dirty_keys.update(state)
+    else:
+        return State()
 
+    if state:
         ratings = state.get("ratings")
         ratings_source = state.get("ratings_source")
         if ratings_source is None and _looks_like_paine_ratings(ratings):
@@ -57,8 +178,105 @@ def load_state() -> dict:
             state.pop("optimized", None)
             save_state(state)
 
-        return state
-    return {}
+    return state
+
+
+def _read_state_dir() -> dict:
+    """Reassemble the state dict from the per-key files in data/state/."""
+    import msgpack
+    import pickle
+
+    state: dict = {}
+
+    if _usable_state_file(META_STATE_FILE):
+        try:
+            with open(META_STATE_FILE, "r", encoding="utf-8") as f:
+                state.update(json.load(f))
+        except ValueError:
+            os.remove(META_STATE_FILE)
+
+    for key in MSGPACK_STATE_KEYS:
+        path = os.path.join(STATE_DIR, f"{key}.msgpack")
+        if not _usable_state_file(path):
+            # save_state pickles values msgpack couldn't handle.
+            fallback_path = os.path.join(STATE_DIR, f"{key}.pkl")
+            if _usable_state_file(fallback_path):
+                try:
+                    with open(fallback_path, "rb") as f:
+                        state[key] = pickle.load(f)
+                except (pickle.UnpicklingError, EOFError):
+                    os.remove(fallback_path)
+            continue
+        try:
+            with open(path, "rb") as f:
+                value = msgpack.unpackb(f.read(), strict_map_key=False)
+            if key == "reach_probs":
+                value = _unpack_reach_probs(value)
+            state[key] = value
+        except ValueError:
+            # Truncated or incompatible cache: drop it and recompute later.
+            os.remove(path)
+
+    for key in PICKLE_STATE_KEYS:
+        path = os.path.join(STATE_DIR, f"{key}.pkl")
+        if not _usable_state_file(path):
+            continue
+        try:
+            with open(path, "rb") as f:
+                state[key] = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError):
+            os.remove(path)
+
+    return state
+
+
+def _read_legacy_state_file() -> dict:
+    """Read the single-file state.pkl cache written by older versions."""
+    import pickle
+
+    if not _usable_state_file(LEGACY_STATE_FILE):
+        return {}
+    try:
+        with open(LEGACY_STATE_FILE, "rb") as f:
+            return pickle.load(f)
+    except (pickle.UnpicklingError, EOFError):
+        os.remove(LEGACY_STATE_FILE)
+        return {}
+
+
+def _pack_reach_probs(reach_probs: dict[str, dict[int, float]]) -> dict:
+    """Flatten reach probabilities to team names plus one packed float64 buffer.
+
+    The buffer is row-major ``(n_teams, 7)``, column ``r - 1`` = round ``r``;
+    rounds a team has no value for are stored as NaN.
+    """
+    from array import array
+
+    teams = list(reach_probs)
+    nan = float("nan")
+    probs = array("d", (reach_probs[name].get(r, nan) for name in teams for r in range(1, 8)))
+    return {"teams": teams, "probs": probs.tobytes()}
+
+
+def _unpack_reach_probs(packed: dict) -> dict[str, dict[int, float]]:
+    """Inverse of ``_pack_reach_probs``; plain nested dicts pass through unchanged."""
+    from array import array
+
+    if set(packed) != {"teams", "probs"} or not isinstance(packed["probs"], bytes):
+        return packed
+
+    probs = array("d")
+    probs.frombytes(packed["probs"])
+    reach_probs = {}
+    for i, name in enumerate(packed["teams"]):
+        row = probs[i * 7:(i + 1) * 7]
+        reach_probs[name] = {r: p for r, p in enumerate(row, 1) if p == p}
+    return reach_probs
+
+
+def _usable_state_file(path: str) -> bool:
+    """Check that a cache file exists and is non-empty."""
+    return os.path.exists(path) and os.path.getsize(path) > 0
 
 
 def _looks_like_paine_ratings(ratings: dict | None) -> bool:
@@ -101,7 +319,9 @@ def cmd_fetch_ratings(args):
     from ingestion.ratings_sources import fetch_ratings_from_source
 
     try:
-        ratings = fetch_ratings_from_source(args.source, year=args.year, save=True, file=args.file)
+        ratings = fetch_ratings_from_source(
+            args.source, year=args.year, save=True, file=args.file, refresh=args.refresh
+        )
     except Exception as e:
         print(f"ERROR: {e}")
         return
@@ -113,10 +333,10 @@ def cmd_fetch_ratings(args):
     save_state(state)
 
     # Print top teams
-    sorted_teams = sorted(ratings.items(), key=lambda x: x[1].get("rating", 0), reverse=True)
+    top_teams = heapq.nlargest(20, ratings.items(), key=lambda x: x[1].get("rating", 0))
     print(f"\nLoaded ratings for {len(ratings)} teams.")
     print("\nTop 20 teams by rating:")
-    for i, (name, data) in enumerate(sorted_teams[:20], 1):
+    for i, (name, data) in enumerate(top_teams, 1):
         r = data.get("rating", 0)
         print(f"  {i:2d}. {name:<25s} {r:.4f}")
 
@@ -160,10 +380,13 @@ def cmd_fetch_picks(args):
             challenge_id=args.challenge_id,
             ratings=ratings,
             bracket_teams=bracket_teams,
+            refresh=args.refresh,
         )
     elif args.source == "yahoo":
         from ingestion.pick_popularity import fetch_yahoo_picks
-        pick_pcts = fetch_yahoo_picks(year=args.year, ratings=ratings)
+        pick_pcts = fetch_yahoo_picks(year=args.year, ratings=ratings, refresh=args.refresh)
+    elif args.source == "both":
+        pick_pcts = _fetch_espn_and_yahoo_picks(args, ratings, bracket_teams)
     else:
         print(f"Unknown source: {args.source}")
         return
@@ -184,6 +407,38 @@ def cmd_fetch_picks(args):
         print(f"\nLoaded pick percentages for {len(pick_pcts)} teams")
 
 
+def _fetch_espn_and_yahoo_picks(args, ratings: dict, bracket_teams: set[str]) -> dict[str, dict[int, float]]:
+    """Fetch ESPN and Yahoo picks concurrently and blend them into a consensus.
+
+    Both fetches are network-bound, so threads overlap the downloads.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from ingestion.pick_popularity import fetch_espn_picks, fetch_yahoo_picks
+    from optimizer.pick_utils import build_consensus_pick_pcts
+
+    picks_by_source = {}
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = {
+            pool.submit(
+                fetch_espn_picks,
+                year=args.year,
+                challenge_id=args.challenge_id,
+                ratings=ratings,
+                bracket_teams=bracket_teams,
+                refresh=args.refresh,
+            ): "espn",
+            pool.submit(fetch_yahoo_picks, year=args.year, ratings=ratings, refresh=args.refresh): "yahoo",
+        }
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                picks_by_source[source] = future.result()
+            except Exception as e:
+                print(f"Warning: Could not fetch {source} picks: {e}")
+
+    return build_consensus_pick_pcts(picks_by_source, allowed_teams=bracket_teams or None)
+
+
 def cmd_simulate(args):
     """Run Monte Carlo tournament simulation."""
     state = load_state()
@@ -193,25 +448,33 @@ def cmd_simulate(args):
         print("ERROR: No bracket loaded. Run 'python cli.py load-bracket' first.")
         return
 
+    import numpy as np
+    from optimizer.reach_prob_utils import reach_probs_to_array, resolve_reach_probs
+
     ratings = state.get("ratings", {})
     reach_probs = resolve_reach_probs(
         bracket,
         ratings,
         n_sims=args.sims,
         seed=42,
-        show_progress=True,
+        show_progress=not args.quiet,
+        n_workers=args.workers,
+        backend=args.backend,
     )
 
     state["reach_probs"] = reach_probs
     save_state(state)
 
     # Print top championship probabilities
-    champ_probs = [(name, probs.get(7, 0)) for name, probs in reach_probs.items()]
-    champ_probs.sort(key=lambda x: x[1], reverse=True)
+    team_names, probs = reach_probs_to_array(reach_probs)
+    champ_col = probs[:, 6]
+    k = min(15, len(team_names))
+    top_idx = np.argpartition(-champ_col, k - 1)[:k] if k else []
+    top_idx = sorted(top_idx, key=lambda i: -champ_col[i])
 
     print(f"\nTop 15 championship probabilities:")
-    for name, p in champ_probs[:15]:
-        print(f"  {name:<25s} {p:.1%}")
+    for i in top_idx:
+        print(f"  {team_names[i]:<25s} {champ_col[i]:.1%}")
 
 
 def cmd_optimize(args):
@@ -227,13 +490,14 @@ def cmd_optimize(args):
     reach_probs = state.get("reach_probs")
     if not reach_probs:
         print("Running tournament simulation first...")
+        from optimizer.reach_prob_utils import resolve_reach_probs
         ratings = state.get("ratings", {})
         reach_probs = resolve_reach_probs(
             bracket,
             ratings,
             n_sims=args.sims,
             seed=42,
-            show_progress=True,
+            show_progress=not args.quiet,
         )
         state["reach_probs"] = reach_probs
 
@@ -265,6 +529,7 @@ def cmd_optimize(args):
         accuracy_weight=args.accuracy_weight,
         n_sims=args.sims,
         force_champion=args.force_champion,
+        quiet=args.quiet,
     )
 
     state["optimized"] = optimized
@@ -323,7 +588,67 @@ def cmd_export(args):
 
 # --- Main ---
 
-def main():
+def _add_fetch_ratings_args(p):
+    p.add_argument(
+        "--source",
+        choices=["consensus", "torvik", "kenpom", "espn", "paine", "draftkings", "manual"],
+        default=config.DEFAULT_SIMULATION_SOURCE,
+    )
+    p.add_argument("--year", type=int, default=2026)
+    p.add_argument("--file", help="CSV file path (for --source manual, paine, or draftkings)")
+    p.add_argument("--refresh", action="store_true", help="Ignore cached raw pages and refetch")
+
+
+def _add_load_bracket_args(p):
+    p.add_argument("--file", help="JSON file with bracket data")
+    p.add_argument("--interactive", action="store_true", help="Enter bracket interactively")
+
+
+def _add_fetch_picks_args(p):
+    p.add_argument("--source", choices=["espn", "yahoo", "both"], default="espn")
+    p.add_argument("--year", type=int, default=2026)
+    p.add_argument("--challenge-id", type=int, help="Override ESPN Tournament Challenge challengeId")
+    p.add_argument("--manual", help="CSV file with pick percentages")
+    p.add_argument("--refresh", action="store_true", help="Ignore cached raw pages and refetch")
+
+
+def _add_simulate_args(p):
+    p.add_argument("--sims", type=int, default=config.DEFAULT_SIMULATIONS)
+    p.add_argument("--workers", type=int, default=None,
+                   help=f"Processes to split the sims across (default: {config.SIM_WORKERS})")
+    p.add_argument("--backend", choices=["numpy", "cuda"], default=None,
+                   help=f"Simulate on the CPU or on the GPU via CuPy (default: {config.SIM_BACKEND})")
+    p.add_argument("--quiet", action="store_true", help="Hide the progress bar")
+
+
+def _add_optimize_args(p):
+    p.add_argument("--pool-size", type=int, default=config.DEFAULT_POOL_SIZE)
+    p.add_argument("--accuracy-weight", type=float, default=config.DEFAULT_ACCURACY_WEIGHT)
+    p.add_argument("--sims", type=int, default=config.DEFAULT_SIMULATIONS)
+    p.add_argument("--force-champion", help="Force a specific team as champion")
+    p.add_argument("--no-picks", action="store_true", help="Run without pick popularity data")
+    p.add_argument("--quiet", action="store_true", help="Hide progress bars and phase-by-phase output")
+
+
+def _add_export_args(p):
+    p.add_argument("--format", choices=["yahoo", "csv", "html"], default="yahoo")
+    p.add_argument("--output", help="Output file path (for csv/html formats)")
+
+
+# command -> (handler, help text, argument setup)
+COMMANDS = {
+    "fetch-ratings": (cmd_fetch_ratings, "Fetch team power ratings", _add_fetch_ratings_args),
+    "load-bracket": (cmd_load_bracket, "Load the 64-team bracket", _add_load_bracket_args),
+    "fetch-picks": (cmd_fetch_picks, "Fetch public pick percentages", _add_fetch_picks_args),
+    "simulate": (cmd_simulate, "Run Monte Carlo tournament simulation", _add_simulate_args),
+    "optimize": (cmd_optimize, "Run bracket optimizer", _add_optimize_args),
+    "show": (cmd_show, "Display the optimized bracket", None),
+    "export": (cmd_export, "Export the optimized bracket", _add_export_args),
+}
+
+
+def _build_full_parser() -> argparse.ArgumentParser:
+    """Build the top-level parser with every subcommand (used for help/unknown verbs)."""
     parser = argparse.ArgumentParser(
         description="March Madness Bracket Optimizer",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -337,70 +662,38 @@ Workflow:
         """
     )
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    for name, (_, help_text, add_args) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        if add_args is not None:
+            add_args(sub)
+    return parser
 
-    # fetch-ratings
-    p_ratings = subparsers.add_parser("fetch-ratings", help="Fetch team power ratings")
-    p_ratings.add_argument(
-        "--source",
-        choices=["consensus", "torvik", "kenpom", "espn", "paine", "draftkings", "manual"],
-        default=config.DEFAULT_SIMULATION_SOURCE,
-    )
-    p_ratings.add_argument("--year", type=int, default=2026)
-    p_ratings.add_argument("--file", help="CSV file path (for --source manual, paine, or draftkings)")
-
-    # load-bracket
-    p_bracket = subparsers.add_parser("load-bracket", help="Load the 64-team bracket")
-    p_bracket.add_argument("--file", help="JSON file with bracket data")
-    p_bracket.add_argument("--interactive", action="store_true", help="Enter bracket interactively")
-
-    # fetch-picks
-    p_picks = subparsers.add_parser("fetch-picks", help="Fetch public pick percentages")
-    p_picks.add_argument("--source", choices=["espn", "yahoo"], default="espn")
-    p_picks.add_argument("--year", type=int, default=2026)
-    p_picks.add_argument("--challenge-id", type=int, help="Override ESPN Tournament Challenge challengeId")
-    p_picks.add_argument("--manual", help="CSV file with pick percentages")
-
-    # simulate
-    p_sim = subparsers.add_parser("simulate", help="Run Monte Carlo tournament simulation")
-    p_sim.add_argument("--sims", type=int, default=config.DEFAULT_SIMULATIONS)
-
-    # optimize
-    p_opt = subparsers.add_parser("optimize", help="Run bracket optimizer")
-    p_opt.add_argument("--pool-size", type=int, default=config.DEFAULT_POOL_SIZE)
-    p_opt.add_argument("--accuracy-weight", type=float, default=config.DEFAULT_ACCURACY_WEIGHT)
-    p_opt.add_argument("--sims", type=int, default=config.DEFAULT_SIMULATIONS)
-    p_opt.add_argument("--force-champion", help="Force a specific team as champion")
-    p_opt.add_argument("--no-picks", action="store_true", help="Run without pick popularity data")
-
-    # show
-    subparsers.add_parser("show", help="Display the optimized bracket")
-
-    # export
-    p_export = subparsers.add_parser("export", help="Export the optimized bracket")
-    p_export.add_argument("--format", choices=["yahoo", "csv", "html"], default="yahoo")
-    p_export.add_argument("--output", help="Output file path (for csv/html formats)")
-
-    args = parser.parse_args()
 
-    if not args.command:
-        parser.print_help()
+def main():
+    argv = sys.argv[1:]
+
+    # Fast path: a known verb only needs its own options, so skip building
+    # the other subparsers and the top-level help formatter.
+    if argv and argv[0] in COMMANDS:
+        command = argv[0]
+        cmd_func, help_text, add_args = COMMANDS[command]
+        parser = argparse.ArgumentParser(
+            prog=f"{os.path.basename(sys.argv[0])} {command}",
+            description=help_text,
+        )
+        if add_args is not None:
+            add_args(parser)
+        args = parser.parse_args(argv[1:])
+        args.command = command
+        cmd_func(args)
         return
 
-    commands = {
-        "fetch-ratings": cmd_fetch_ratings,
-        "load-bracket": cmd_load_bracket,
-        "fetch-picks": cmd_fetch_picks,
-        "simulate": cmd_simulate,
-        "optimize": cmd_optimize,
-        "show": cmd_show,
-        "export": cmd_export,
-    }
-
-    cmd_func = commands.get(args.command)
-    if cmd_func:
-        cmd_func(args)
-    else:
+    parser = _build_full_parser()
+    args = parser.parse_args(argv)
+    if not args.command:
         parser.print_help()
+        return
+    COMMANDS[args.command][0](args)
 
 
 if __name__ == "__main__":
@@ -17,6 +17,10 @@ DEFAULT_POOL_SIZE = 7
 
 # Optimizer settings
 DEFAULT_SIMULATIONS = 10_000
+SIM_WORKERS = 1  # Processes for simulate_tournament; >1 splits the sims across cores
+SIM_CHUNK = 8192  # Sims played per vectorized block, sized to keep the working set in L2
+SIM_BACKEND = "numpy"  # "numpy", or "cuda" to simulate on the GPU (needs CuPy)
+GPU_SIM_CHUNK = 1 << 20  # Sims per block on the GPU backend
 DEFAULT_ACCURACY_WEIGHT = 0.75  # 0=full contrarian, 1=full accuracy
 DEFAULT_SIMULATION_SOURCE = "consensus"
 
@@ -78,6 +82,8 @@ SCORING_PRESETS = {
     "espn": {1: 10, 2: 20, 3: 40, 4: 80, 5: 160, 6: 320},
 }
 F4_CANDIDATES_PER_REGION = 8   # Top N teams per region to consider for Final Four
+VALIDATION_OPPONENT_POOL = 2000  # Opponent brackets drawn once per validation run, resampled per sim
+VALIDATION_CHUNK = 1000  # Sims scored per compiled validation call, between progress updates
 
 # Bracket structure
 NUM_TEAMS = 64
@@ -100,6 +106,10 @@ PICK_SOURCE_WEIGHTS = {
     "cbs": 0.10,
 }
 
+# Raw scraped pages in data/raw/ are reused for this long before refetching.
+# Pass --refresh on the fetch commands to bypass the cache.
+FETCH_CACHE_TTL_SECONDS = 3600
+
 # ESPN Tournament Challenge public-pick ingestion.
 ESPN_PICKS_PROPOSITIONS_URL = "https://gambit-api.fantasy.espn.com/apis/v1/propositions"
 ESPN_PICKS_SCORING_PERIODS = (1, 2, 3, 4, 5, 6)
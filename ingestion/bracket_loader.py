@@ -6,13 +6,32 @@ Supports:
 3. Programmatic construction
 """
 
-import json
+from difflib import get_close_matches
+from functools import lru_cache
 import os
+import re
 
 import config
+from ingestion.json_io import read_json, write_json
 from models.bracket import Bracket, SEED_ORDER
 from models.team import Team
 
+ALIASES_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "team_aliases.json")
+
+# Rough historical Barthag equivalents by seed; index 0 is the fallback.
+_SEED_DEFAULTS = (
+    0.50,
+    0.95, 0.92, 0.89, 0.86, 0.83, 0.80,
+    0.77, 0.74, 0.72, 0.70, 0.68, 0.65,
+    0.55, 0.45, 0.35, 0.25,
+)
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
+# Normalized key index (plus resolved-name memo) for the ratings table
+# currently being matched against.
+_lookup_index: dict[int, tuple[dict[str, str], dict[str, list[str]], dict[str, str | None]]] = {}
+
 
 def load_bracket_interactive(ratings: dict[str, dict] | None = None) -> Bracket:
     """Interactively enter the 64-team bracket via CLI prompts.
@@ -21,35 +40,28 @@ def load_bracket_interactive(ratings: dict[str, dict] | None = None) -> Bracket:
         ratings: Optional pre-loaded team ratings to auto-fill power ratings
     """
     bracket = Bracket()
+    _lookup_index.clear()
 
     print("\n=== BRACKET ENTRY ===")
     print("Enter teams for each region. Use standard team names.")
-    print("Seeds are entered in order: 1, 16, 8, 9, 5, 12, 4, 13, 6, 11, 3, 14, 7, 10, 2, 15\n")
+    print("Paste all 16 teams at once, one per line or comma-separated, then a blank line.")
+    print("Seeds are entered in order: 1, 16, 8, 9, 5, 12, 4, 13, 6, 11, 3, 14, 7, 10, 2, 15")
+    print("Leave a comma-separated field empty to skip a seed.\n")
 
     for region_idx in range(4):
         region_name = input(f"Region {region_idx + 1} name [{config.REGION_NAMES[region_idx]}]: ").strip()
         if not region_name:
             region_name = config.REGION_NAMES[region_idx]
 
-        teams_by_seed = {}
-        for seed in SEED_ORDER:
-            name = input(f"  {region_name} #{seed} seed: ").strip()
-            if not name:
-                continue
-
-            # Look up rating if available
-            rating_info = _lookup_rating(name, ratings) if ratings else {}
-
-            team = Team(
-                name=name,
-                seed=seed,
-                region=region_name,
-                rating=rating_info.get("rating", _default_rating_for_seed(seed)),
-                adj_offense=rating_info.get("adj_offense", 100.0),
-                adj_defense=rating_info.get("adj_defense", 100.0),
-                reach_probs=rating_info.get("reach_probs", {}),
-            )
-            teams_by_seed[seed] = team
+        names = _read_team_block(f"  {region_name} teams:")
+        if len(names) > len(SEED_ORDER):
+            print(f"  Warning: ignoring {len(names) - len(SEED_ORDER)} extra team(s)")
+
+        teams_by_seed = {
+            seed: _build_team(name, seed, region_name, ratings)
+            for seed, name in zip(SEED_ORDER, names)
+            if name
+        }
 
         bracket.set_teams_for_region(region_idx, region_name, teams_by_seed)
         print(f"  -> {region_name} loaded with {len(teams_by_seed)} teams\n")
@@ -57,6 +69,25 @@ def load_bracket_interactive(ratings: dict[str, dict] | None = None) -> Bracket:
     return bracket
 
 
+def _read_team_block(prompt: str) -> list[str]:
+    """Read a pasted block of team names, ended by a blank line or EOF.
+
+    Lines may hold one team each or several comma-separated teams. Empty
+    comma fields are kept as "" so they still consume a seed position.
+    """
+    print(prompt)
+    names: list[str] = []
+    while True:
+        try:
+            line = input()
+        except EOFError:
+            break
+        if not line.strip():
+            break
+        names.extend(part.strip() for part in line.split(","))
+    return names
+
+
 def load_bracket_from_json(filepath: str, ratings: dict[str, dict] | None = None) -> Bracket:
     """Load bracket from a JSON file.
 
@@ -71,8 +102,7 @@ def load_bracket_from_json(filepath: str, ratings: dict[str, dict] | None = None
         ]
     }
     """
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(filepath)
 
     bracket = load_bracket_from_dict(data, ratings)
     print(f"Loaded bracket from {filepath}: {len(bracket.teams)} teams in {len(bracket.regions)} regions")
@@ -87,31 +117,34 @@ def load_bracket_from_dict(data: dict, ratings: dict[str, dict] | None = None) -
         ratings: Optional pre-loaded team ratings
     """
     bracket = Bracket()
+    _lookup_index.clear()
 
     for region_idx, region_data in enumerate(data["regions"]):
         region_name = region_data["name"]
-        teams_by_seed = {}
-
-        for seed_str, name in region_data["teams"].items():
-            seed = int(seed_str)
-            rating_info = _lookup_rating(name, ratings) if ratings else {}
-
-            team = Team(
-                name=name,
-                seed=seed,
-                region=region_name,
-                rating=rating_info.get("rating", _default_rating_for_seed(seed)),
-                adj_offense=rating_info.get("adj_offense", 100.0),
-                adj_defense=rating_info.get("adj_defense", 100.0),
-                reach_probs=rating_info.get("reach_probs", {}),
-            )
-            teams_by_seed[seed] = team
+        teams_by_seed = {
+            int(seed_str): _build_team(name, int(seed_str), region_name, ratings)
+            for seed_str, name in region_data["teams"].items()
+        }
 
         bracket.set_teams_for_region(region_idx, region_name, teams_by_seed)
 
     return bracket
 
 
+def _build_team(name: str, seed: int, region: str, ratings: dict[str, dict] | None) -> Team:
+    """Create a Team, filling ratings from ``ratings`` or seed defaults."""
+    rating_info = _lookup_rating(name, ratings) if ratings else {}
+    return Team(
+        name=name,
+        seed=seed,
+        region=region,
+        rating=rating_info.get("rating", _default_rating_for_seed(seed)),
+        adj_offense=rating_info.get("adj_offense", 100.0),
+        adj_defense=rating_info.get("adj_defense", 100.0),
+        reach_probs=dict(rating_info.get("reach_probs") or {}),
+    )
+
+
 def save_bracket_to_json(bracket: Bracket, filepath: str):
     """Save a bracket's team placements to JSON."""
     data = {"regions": []}
@@ -129,13 +162,12 @@ def save_bracket_to_json(bracket: Bracket, filepath: str):
         data["regions"].append({"name": region_name, "teams": teams})
 
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    write_json(filepath, data)
     print(f"Saved bracket to {filepath}")
 
 
 def _lookup_rating(name: str, ratings: dict[str, dict] | None) -> dict:
-    """Look up a team's rating, trying exact match then fuzzy match."""
+    """Look up a team's rating: exact, alias, normalized key, then fuzzy match."""
     if not ratings:
         return {}
 
@@ -143,30 +175,77 @@ def _lookup_rating(name: str, ratings: dict[str, dict] | None) -> dict:
     if name in ratings:
         return ratings[name]
 
+    norm_to_key, norm_keys_by_initial, resolved = _build_lookup_index(ratings)
+    if name not in resolved:
+        resolved[name] = _resolve_rating_key(name, ratings, norm_to_key, norm_keys_by_initial)
+    key = resolved[name]
+    return ratings[key] if key is not None else {}
+
+
+def _resolve_rating_key(name: str,
+                        ratings: dict[str, dict],
+                        norm_to_key: dict[str, str],
+                        norm_keys_by_initial: dict[str, list[str]]) -> str | None:
+    """Find the ratings key for a name that has no exact match."""
     # Try aliases
-    aliases_path = os.path.join(os.path.dirname(__file__), "..", "data", "team_aliases.json")
-    if os.path.exists(aliases_path):
-        with open(aliases_path, "r") as f:
-            aliases = json.load(f)
-        canonical = aliases.get(name, name)
-        if canonical in ratings:
-            return ratings[canonical]
+    canonical = _load_aliases().get(name, name)
+    if canonical in ratings:
+        return canonical
 
-    # Fuzzy match
-    from difflib import get_close_matches
-    matches = get_close_matches(name, ratings.keys(), n=1, cutoff=0.7)
-    if matches:
-        return ratings[matches[0]]
+    # Case/punctuation differences ("St. John's" vs "st johns")
+    normalized = _normalize_team_key(name)
+    if normalized in norm_to_key:
+        return norm_to_key[normalized]
 
-    return {}
+    # Fuzzy match, only against keys sharing the first character
+    if normalized:
+        candidates = norm_keys_by_initial.get(normalized[0], [])
+        matches = get_close_matches(normalized, candidates, n=1, cutoff=0.7)
+        if matches:
+            return norm_to_key[matches[0]]
+
+    return None
+
+
+def _normalize_team_key(name: str) -> str:
+    """Lowercase and strip everything but letters and digits."""
+    return _NON_ALNUM_RE.sub("", name.lower())
+
+
+@lru_cache(maxsize=1)
+def _load_aliases() -> dict[str, str]:
+    """Load the shared team alias table."""
+    if not os.path.exists(ALIASES_PATH):
+        return {}
+    return read_json(ALIASES_PATH)
+
+
+def _build_lookup_index(ratings: dict[str, dict]):
+    """Index rating keys by normalized name, built once per ratings table.
+
+    Returns:
+        (normalized name -> original key,
+         first character -> normalized names for difflib,
+         memo of lookup name -> resolved key or None)
+    """
+    ratings_id = id(ratings)
+    index = _lookup_index.get(ratings_id)
+    if index is None:
+        norm_to_key: dict[str, str] = {}
+        for key in ratings:
+            norm_to_key.setdefault(_normalize_team_key(key), key)
+        norm_to_key.pop("", None)
+
+        norm_keys_by_initial: dict[str, list[str]] = {}
+        for normalized in norm_to_key:
+            norm_keys_by_initial.setdefault(normalized[0], []).append(normalized)
+
+        index = (norm_to_key, norm_keys_by_initial, {})
+        _lookup_index.clear()
+        _lookup_index[ratings_id] = index
+    return index
 
 
 def _default_rating_for_seed(seed: int) -> float:
     """Provide a reasonable default rating based on seed when no data is available."""
-    # Rough historical Barthag equivalents by seed
-    defaults = {
-        1: 0.95, 2: 0.92, 3: 0.89, 4: 0.86, 5: 0.83, 6: 0.80,
-        7: 0.77, 8: 0.74, 9: 0.72, 10: 0.70, 11: 0.68, 12: 0.65,
-        13: 0.55, 14: 0.45, 15: 0.35, 16: 0.25,
-    }
-    return defaults.get(seed, 0.50)
+    return _SEED_DEFAULTS[seed] if 1 <= seed <= 16 else 0.50
@@ -4,36 +4,44 @@ Scrapes team BPI ratings from ESPN's college basketball BPI page.
 Free, no auth required, but layout may change between seasons.
 """
 
+from functools import lru_cache
 import os
-import requests
-from bs4 import BeautifulSoup
+import re
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data", "raw")
 
 BPI_URL = "https://www.espn.com/mens-college-basketball/bpi"
 
+BPI_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
 
-def fetch_espn_bpi(save: bool = True) -> dict[str, dict]:
+# Only cells that look like plain decimals are worth a float() attempt.
+_NUM_RE = re.compile(r"^-?\d+(?:\.\d+)?$")
+
+
+def fetch_espn_bpi(save: bool = True, refresh: bool = False) -> dict[str, dict]:
     """Scrape ESPN BPI ratings.
 
+    The raw page is cached in ``data/raw/espn_bpi.html`` and reused for
+    ``config.FETCH_CACHE_TTL_SECONDS`` unless ``refresh`` is set.
+
     Returns:
         {team_name: {"bpi": float, "rank": int}}
     """
-    print(f"Fetching ESPN BPI from {BPI_URL}...")
-
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    }
-    resp = requests.get(BPI_URL, headers=headers, timeout=30)
-    resp.raise_for_status()
+    from ingestion.http_session import cached_fetch
 
-    if save:
-        os.makedirs(DATA_DIR, exist_ok=True)
-        path = os.path.join(DATA_DIR, "espn_bpi.html")
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(resp.text)
+    print(f"Fetching ESPN BPI from {BPI_URL}...")
 
-    return _parse_bpi_html(resp.text)
+    html = cached_fetch(
+        _get_session(),
+        BPI_URL,
+        os.path.join(DATA_DIR, "espn_bpi.html"),
+        refresh=refresh,
+        save=save,
+        timeout=30,
+    )
+    return _parse_bpi_html(html)
 
 
 def _parse_bpi_html(html: str) -> dict[str, dict]:
@@ -42,16 +50,18 @@ def _parse_bpi_html(html: str) -> dict[str, dict]:
     ESPN's BPI page uses JavaScript rendering, so simple HTML parsing may
     only get partial data. This attempts to extract what's available.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
     ratings = {}
 
     # ESPN table rows typically have class patterns like "Table__TR"
-    rows = soup.select("tr.Table__TR")
+    rows = tree.css("tr.Table__TR")
     if not rows:
-        rows = soup.find_all("tr")
+        rows = tree.css("tr")
 
     for row in rows:
-        cells = row.find_all("td")
+        cells = row.css("td")
         if len(cells) < 3:
             continue
 
@@ -60,27 +70,26 @@ def _parse_bpi_html(html: str) -> dict[str, dict]:
         team_cell = cells[0] if len(cells) > 0 else None
         if team_cell:
             # Team name might be in an anchor tag
-            link = team_cell.find("a")
-            name = link.get_text(strip=True) if link else team_cell.get_text(strip=True)
+            link = team_cell.css_first("a")
+            name = link.text(strip=True) if link else team_cell.text(strip=True)
             if not name or name.isdigit():
                 # This might be the rank column, try next cell
                 if len(cells) > 1:
-                    link = cells[1].find("a")
-                    name = link.get_text(strip=True) if link else cells[1].get_text(strip=True)
+                    link = cells[1].css_first("a")
+                    name = link.text(strip=True) if link else cells[1].text(strip=True)
 
             if name and not name.isdigit():
                 try:
                     # BPI is typically in the 3rd or 4th column
                     bpi = None
-                    for cell in cells[1:]:
-                        text = cell.get_text(strip=True)
-                        try:
-                            val = float(text)
-                            if -30 < val < 50:  # BPI range is roughly -25 to 40
-                                bpi = val
-                                break
-                        except ValueError:
+                    texts = [cell.text(strip=True) for cell in cells[1:]]
+                    for text in texts:
+                        if not _NUM_RE.match(text):
                             continue
+                        val = float(text)
+                        if -30 < val < 50:  # BPI range is roughly -25 to 40
+                            bpi = val
+                            break
 
                     if bpi is not None:
                         ratings[name] = {"bpi": bpi}
@@ -94,6 +103,14 @@ def _parse_bpi_html(html: str) -> dict[str, dict]:
     return ratings
 
 
+@lru_cache(maxsize=1)
+def _get_session():
+    """Create the shared BPI session on first use (defers importing requests)."""
+    from ingestion.http_session import build_session
+
+    return build_session(BPI_HEADERS)
+
+
 def bpi_to_rating(bpi: float, bpi_min: float = -25.0, bpi_max: float = 40.0) -> float:
     """Convert BPI score to a 0-1 rating scale.
 
@@ -0,0 +1,83 @@
+"""Shared HTTP session setup and raw-response cache for the scraping ingestors."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import config
+
+
+def build_session(headers: dict[str, str] | None = None) -> requests.Session:
+    """Create a keep-alive session with a small connection pool and retries.
+
+    Reusing one session per module keeps TLS connections warm across
+    repeated fetches; gzip is requested explicitly since ESPN/Yahoo pages
+    compress well.
+    """
+    session = requests.Session()
+    session.headers.update(headers or {})
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def read_fresh_cache(path: str, ttl_sec: float | None = None) -> str | None:
+    """Return the cached text at ``path`` if it was written within ``ttl_sec``."""
+    if ttl_sec is None:
+        ttl_sec = config.FETCH_CACHE_TTL_SECONDS
+    try:
+        age = time.time() - os.path.getmtime(path)
+    except OSError:
+        return None
+    if age > ttl_sec:
+        return None
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def cached_fetch(session: requests.Session,
+                 url: str,
+                 path: str,
+                 ttl_sec: float | None = None,
+                 refresh: bool = False,
+                 save: bool = True,
+                 **kwargs) -> str:
+    """GET ``url`` as text, reusing ``path`` if it is younger than ``ttl_sec``.
+
+    Args:
+        session: Session used when the cache is stale or missing.
+        url: Page to fetch.
+        path: Raw cache file; rewritten after a successful fetch when ``save``.
+        ttl_sec: Cache lifetime, defaulting to ``config.FETCH_CACHE_TTL_SECONDS``.
+        refresh: Skip the cache and always hit the network.
+        save: Write the fetched text back to ``path``.
+        **kwargs: Passed through to ``session.get``.
+
+    Returns:
+        The response (or cached) body text.
+    """
+    if not refresh:
+        cached = read_fresh_cache(path, ttl_sec)
+        if cached is not None:
+            return cached
+
+    resp = session.get(url, **kwargs)
+    resp.raise_for_status()
+
+    if save:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(resp.text)
+    return resp.text
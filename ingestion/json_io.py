@@ -0,0 +1,40 @@
+"""JSON file helpers that use orjson when it is installed.
+
+orjson encodes/decodes straight to and from bytes and is several times
+faster than the stdlib on the nested dict-of-str/float payloads used here.
+"""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj) -> bytes:
+    """Serialize ``obj`` to 2-space indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def loads(data: bytes | str):
+    """Parse JSON from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(filepath: str):
+    """Read and parse a JSON file."""
+    with open(filepath, "rb") as f:
+        return loads(f.read())
+
+
+def write_json(filepath: str, obj):
+    """Write ``obj`` to a JSON file."""
+    with open(filepath, "wb") as f:
+        f.write(dumps(obj))
@@ -3,10 +3,27 @@
 Used when scraping is unavailable or the user prefers manual input.
 """
 
+from __future__ import annotations
+
 import csv
 import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Rough multipliers: if X% pick team as champion,
+# what % pick them in each prior round?
+# These are approximate historical patterns.
+_CHAMPION_SEED_MULTIPLIERS = {
+    1: {1: 0.98, 2: 0.90, 3: 0.75, 4: 0.55, 5: 0.40},
+    2: {1: 0.95, 2: 0.82, 3: 0.60, 4: 0.40, 5: 0.28},
+    3: {1: 0.90, 2: 0.70, 3: 0.45, 4: 0.25, 5: 0.15},
+    4: {1: 0.85, 2: 0.60, 3: 0.35, 4: 0.18, 5: 0.10},
+}
 
-import pandas as pd
+# For seeds 5+, use generic low multipliers
+_DEFAULT_CHAMPION_MULTIPLIERS = {1: 0.75, 2: 0.45, 3: 0.20, 4: 0.08, 5: 0.04}
 
 
 def load_ratings_from_csv(filepath: str) -> dict[str, dict]:
@@ -15,17 +32,25 @@ def load_ratings_from_csv(filepath: str) -> dict[str, dict]:
     Expected columns: team, rating [, adj_offense, adj_defense, conference]
     Rating should be 0-1 scale (like Barthag).
     """
+    import pandas as pd
+
     df = pd.read_csv(filepath)
-    ratings = {}
-
-    for _, row in df.iterrows():
-        name = str(row.iloc[0]).strip()
-        ratings[name] = {
-            "rating": float(row.iloc[1]) if len(row) > 1 else 0.5,
-            "adj_offense": float(row.iloc[2]) if len(row) > 2 else 100.0,
-            "adj_defense": float(row.iloc[3]) if len(row) > 3 else 100.0,
-            "conference": str(row.iloc[4]).strip() if len(row) > 4 else "",
-        }
+    n_cols = df.shape[1]
+
+    # Coerce whole columns at once instead of casting cell-by-cell.
+    names = df.iloc[:, 0].astype(str).str.strip().tolist()
+    rating = _numeric_column(df, 1, 0.5)
+    offense = _numeric_column(df, 2, 100.0)
+    defense = _numeric_column(df, 3, 100.0)
+    if n_cols > 4:
+        conference = df.iloc[:, 4].astype(str).str.strip().tolist()
+    else:
+        conference = [""] * len(df)
+
+    ratings = dict(zip(names, (
+        {"rating": r, "adj_offense": o, "adj_defense": d, "conference": c}
+        for r, o, d, c in zip(rating, offense, defense, conference)
+    )))
 
     print(f"Loaded ratings for {len(ratings)} teams from {filepath}")
     return ratings
@@ -39,22 +64,25 @@ def load_pick_pcts_from_csv(filepath: str) -> dict[str, dict[int, float]]:
     Percentages should be 0-100 (will be converted to 0-1).
     Stored keys use the optimizer's "reach round N" convention: 2-7.
     """
+    import numpy as np
+    import pandas as pd
+
     df = pd.read_csv(filepath)
-    pick_pcts = {}
+    names = df.iloc[:, 0].astype(str).str.strip().tolist()
 
-    for _, row in df.iterrows():
-        name = str(row.iloc[0]).strip()
-        pcts = {}
-        for r in range(1, 7):
-            col_idx = r  # columns 1-6 map to game wins in rounds 1-6
-            if col_idx < len(row):
-                try:
-                    val = float(row.iloc[col_idx])
-                    # Convert from 0-100 to 0-1 if needed
-                    pcts[r + 1] = val / 100.0 if val > 1.0 else val
-                except (ValueError, TypeError):
-                    pass
+    # columns 1-6 map to game wins in rounds 1-6 -> reach rounds 2-7
+    vals = df.iloc[:, 1:7].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    # Convert from 0-100 to 0-1 if needed
+    vals = np.where(vals > 1.0, vals / 100.0, vals)
+    present = ~np.isnan(vals)
 
+    pick_pcts = {}
+    for name, row, row_present in zip(names, vals.tolist(), present.tolist()):
+        pcts = {
+            col + 2: value
+            for col, (value, ok) in enumerate(zip(row, row_present))
+            if ok
+        }
         if pcts:
             pick_pcts[name] = pcts
 
@@ -62,25 +90,21 @@ def load_pick_pcts_from_csv(filepath: str) -> dict[str, dict[int, float]]:
     return pick_pcts
 
 
+def _numeric_column(df: pd.DataFrame, col_idx: int, default: float) -> list[float]:
+    """Return a column as floats, filling missing or non-numeric cells with ``default``."""
+    import pandas as pd
+
+    if col_idx >= df.shape[1]:
+        return [default] * len(df)
+    return pd.to_numeric(df.iloc[:, col_idx], errors="coerce").fillna(default).astype(float).tolist()
+
+
 def estimate_round_picks_from_champion(champ_pct: float, seed: int) -> dict[int, float]:
     """Estimate per-round pick percentages when only champion % is known.
 
     Uses historical averages of how public pick percentages decay by round and seed.
     """
-    # Rough multipliers: if X% pick team as champion,
-    # what % pick them in each prior round?
-    # These are approximate historical patterns.
-    seed_multipliers = {
-        1: {1: 0.98, 2: 0.90, 3: 0.75, 4: 0.55, 5: 0.40},
-        2: {1: 0.95, 2: 0.82, 3: 0.60, 4: 0.40, 5: 0.28},
-        3: {1: 0.90, 2: 0.70, 3: 0.45, 4: 0.25, 5: 0.15},
-        4: {1: 0.85, 2: 0.60, 3: 0.35, 4: 0.18, 5: 0.10},
-    }
-
-    # For seeds 5+, use generic low multipliers
-    default_mult = {1: 0.75, 2: 0.45, 3: 0.20, 4: 0.08, 5: 0.04}
-
-    multipliers = seed_multipliers.get(seed, default_mult)
+    multipliers = _CHAMPION_SEED_MULTIPLIERS.get(seed, _DEFAULT_CHAMPION_MULTIPLIERS)
 
     pcts = {7: champ_pct}
     for r in range(5, 0, -1):
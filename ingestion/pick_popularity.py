@@ -2,15 +2,13 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import html as html_lib
-import json
 import os
 import re
 
-import requests
-from bs4 import BeautifulSoup
-
 import config
+from ingestion.json_io import loads, read_json, write_json
 from optimizer.pick_utils import merge_pick_pcts
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data", "raw")
@@ -21,6 +19,15 @@ DEFAULT_HEADERS = {
 }
 
 YAHOO_PICKS_URL = "https://tournament.fantasysports.yahoo.com/mens-basketball-bracket/pickdistribution"
+# Fast path for pick-distribution pages: split tables, rows and cells with
+# regexes instead of building a DOM.
+_TABLE_RE = re.compile(r"<table\b.*?</table>", re.S | re.I)
+_ROW_RE = re.compile(r"<tr\b[^>]*>(.*?)</tr>", re.S | re.I)
+_CELL_RE = re.compile(r"<t[dh]\b[^>]*>(.*?)</t[dh]>", re.S | re.I)
+_TAG_RE = re.compile(r"<[^>]+>")
+# The fast path only counts when it recovers the whole field.
+_FULL_FIELD_TEAMS = 64
+
 LEGACY_ESPN_PICKS_URLS = [
     "https://fantasy.espn.com/games/tournament-challenge-bracket/en/whopickedwhom",
     "https://fantasy.espn.com/games/tournament-challenge-bracket-{year}/whopickedwhom",
@@ -31,15 +38,20 @@ def fetch_espn_picks(year: int = 2026,
                      save: bool = True,
                      ratings: dict[str, dict] | None = None,
                      challenge_id: int | None = None,
-                     bracket_teams: set[str] | None = None) -> dict[str, dict[int, float]]:
-    """Fetch ESPN public pick percentages from the current JSON API."""
+                     bracket_teams: set[str] | None = None,
+                     refresh: bool = False) -> dict[str, dict[int, float]]:
+    """Fetch ESPN public pick percentages from the current JSON API.
+
+    Raw payloads saved under ``data/raw/`` are reused while fresh; pass
+    ``refresh=True`` to always hit the network.
+    """
+    import requests
+
     ratings = ratings or {}
     resolver = _build_name_resolver(ratings)
-    session = requests.Session()
-    session.headers.update(DEFAULT_HEADERS)
+    session = _get_session()
 
     partial_pick_sets = []
-    raw_payloads: dict[str, list[dict]] = {}
     resolved_challenge_id = _resolve_espn_challenge_id(year, challenge_id)
     api_error: Exception | None = None
 
@@ -49,39 +61,55 @@ def fetch_espn_picks(year: int = 2026,
             "trying legacy HTML fallback."
         )
     else:
-        for scoring_period_id in config.ESPN_PICKS_SCORING_PERIODS:
-            try:
-                response = session.get(
-                    config.ESPN_PICKS_PROPOSITIONS_URL,
-                    params={
-                        "challengeId": resolved_challenge_id,
-                        "scoringPeriodId": scoring_period_id,
-                    },
-                    timeout=30,
-                )
-                response.raise_for_status()
-                payload = response.json()
-                raw_payloads[str(scoring_period_id)] = payload
-
-                round_picks = _parse_espn_propositions(
-                    payload,
-                    resolver=resolver,
-                    ratings=ratings,
-                    round_reaching=scoring_period_id + 1,
-                    bracket_teams=bracket_teams,
-                )
-                if round_picks:
-                    partial_pick_sets.append(round_picks)
-            except (requests.RequestException, ValueError) as exc:
-                api_error = exc
+        # Keyed by challenge too, so --challenge-id never reuses another challenge's picks.
+        cache_name = f"espn_picks_{year}_{resolved_challenge_id}.json"
+        raw_payloads: dict[str, list[dict]] | None = _load_cached_json(cache_name, refresh)
+        if raw_payloads is None:
+            raw_payloads = {}
+            for scoring_period_id in config.ESPN_PICKS_SCORING_PERIODS:
+                try:
+                    response = session.get(
+                        config.ESPN_PICKS_PROPOSITIONS_URL,
+                        params={
+                            "challengeId": resolved_challenge_id,
+                            "scoringPeriodId": scoring_period_id,
+                        },
+                        timeout=30,
+                    )
+                    response.raise_for_status()
+                    raw_payloads[str(scoring_period_id)] = response.json()
+                except (requests.RequestException, ValueError) as exc:
+                    api_error = exc
+
+            # A partial set would be served as fresh until the TTL ran out,
+            # so only cache when every scoring period came back.
+            if save and raw_payloads and api_error is None:
+                _save_json(cache_name, raw_payloads)
 
-        if save and raw_payloads:
-            _save_json(f"espn_picks_{year}.json", raw_payloads)
+        for scoring_period_id in config.ESPN_PICKS_SCORING_PERIODS:
+            payload = raw_payloads.get(str(scoring_period_id))
+            if payload is None:
+                continue
+            round_picks = _parse_espn_propositions(
+                payload,
+                resolver=resolver,
+                ratings=ratings,
+                round_reaching=scoring_period_id + 1,
+                bracket_teams=bracket_teams,
+            )
+            if round_picks:
+                partial_pick_sets.append(round_picks)
 
         picks = merge_pick_pcts(partial_pick_sets)
         if picks:
             return picks
 
+    cached_html = _load_cached_text(f"espn_picks_{year}.html", refresh)
+    if cached_html is not None:
+        picks = _parse_espn_picks(cached_html, resolver)
+        if picks:
+            return picks
+
     legacy_error: Exception | None = None
     for url_template in LEGACY_ESPN_PICKS_URLS:
         url = url_template.format(year=year)
@@ -107,13 +135,25 @@ def fetch_espn_picks(year: int = 2026,
 def fetch_yahoo_picks(year: int = 2026,
                       game_key: int | None = None,
                       save: bool = True,
-                      ratings: dict[str, dict] | None = None) -> dict[str, dict[int, float]]:
-    """Fetch Yahoo public pick percentages from the bracket API and page."""
+                      ratings: dict[str, dict] | None = None,
+                      refresh: bool = False) -> dict[str, dict[int, float]]:
+    """Fetch Yahoo public pick percentages from the bracket API and page.
+
+    Raw responses saved under ``data/raw/`` are reused while fresh; pass
+    ``refresh=True`` to always hit the network.
+    """
+    import requests
     from ingestion.bracket_fetcher import _discover_yahoo_bracket_payload
+    from ingestion.http_session import cached_fetch
 
     resolver = _build_name_resolver(ratings or {})
-    session = requests.Session()
-    session.headers.update(DEFAULT_HEADERS)
+    session = _get_session()
+
+    cached_payload = _load_cached_json(f"yahoo_pick_distribution_{year}.json", refresh)
+    if cached_payload is not None:
+        picks = _parse_yahoo_api_picks(cached_payload, resolver)
+        if picks:
+            return picks
 
     try:
         payload, resolved_game_key, _ = _discover_yahoo_bracket_payload(
@@ -136,11 +176,15 @@ def fetch_yahoo_picks(year: int = 2026,
         print(f"Warning: Could not fetch Yahoo pick API data: {exc}")
 
     try:
-        response = session.get(YAHOO_PICKS_URL, timeout=30)
-        response.raise_for_status()
-        if save:
-            _save_text(f"yahoo_picks_{year}.html", response.text)
-        return _parse_yahoo_html_picks(response.text, resolver)
+        html = cached_fetch(
+            session,
+            YAHOO_PICKS_URL,
+            os.path.join(DATA_DIR, f"yahoo_picks_{year}.html"),
+            refresh=refresh,
+            save=save,
+            timeout=30,
+        )
+        return _parse_yahoo_html_picks(html, resolver)
     except requests.RequestException as exc:
         print(f"Warning: Could not fetch Yahoo pick page: {exc}")
         return {}
@@ -163,9 +207,10 @@ def _fetch_article_source_picks(source_name: str,
                                 save: bool,
                                 ratings: dict[str, dict] | None) -> dict[str, dict[int, float]]:
     """Fetch partial pick percentages from configured article URLs."""
+    import requests
+
     resolver = _build_name_resolver(ratings or {})
-    session = requests.Session()
-    session.headers.update(DEFAULT_HEADERS)
+    session = _get_session()
 
     partial_pick_sets = []
     for round_reaching, url in url_map.items():
@@ -190,6 +235,14 @@ def _fetch_article_source_picks(source_name: str,
     return merge_pick_pcts(partial_pick_sets)
 
 
+@lru_cache(maxsize=1)
+def _get_session():
+    """Create the shared pick-page session on first use (defers importing requests)."""
+    from ingestion.http_session import build_session
+
+    return build_session(DEFAULT_HEADERS)
+
+
 def _parse_yahoo_api_picks(payload: dict, resolver) -> dict[str, dict[int, float]]:
     """Parse Yahoo API pick distribution data."""
     fantasy_game = payload.get("data", {}).get("fantasyGame") or {}
@@ -216,6 +269,9 @@ def _parse_yahoo_api_picks(payload: dict, resolver) -> dict[str, dict[int, float
 
 def _parse_yahoo_html_picks(html: str, resolver) -> dict[str, dict[int, float]]:
     """Parse Yahoo pick-distribution HTML as a fallback."""
+    picks = _parse_pick_rows_regex(html, resolver)
+    if picks:
+        return picks
     picks = _parse_multi_round_pick_table_html(html, resolver)
     if picks:
         return picks
@@ -224,6 +280,9 @@ def _parse_yahoo_html_picks(html: str, resolver) -> dict[str, dict[int, float]]:
 
 def _parse_espn_picks(html: str, resolver) -> dict[str, dict[int, float]]:
     """Parse ESPN pick pages from HTML tables."""
+    picks = _parse_pick_rows_regex(html, resolver)
+    if picks:
+        return picks
     picks = _parse_multi_round_pick_table_html(html, resolver)
     if picks:
         return picks
@@ -259,12 +318,39 @@ def _parse_espn_propositions(payload,
     return picks
 
 
+def _parse_pick_rows_regex(html: str, resolver) -> dict[str, dict[int, float]]:
+    """Read the multi-round pick table straight from the raw HTML.
+
+    Avoids building a DOM for the common pick-distribution layout. Columns
+    are mapped from the header row exactly as in
+    ``_extract_multi_round_pick_rows_from_table``. Returns {} unless a table
+    covers all 64 teams, so anything less falls back to the table parsers.
+    """
+    best_picks: dict[str, dict[int, float]] = {}
+    for table in _TABLE_RE.findall(html):
+        rows = [
+            [_normalize_text(_TAG_RE.sub(" ", cell)) for cell in _CELL_RE.findall(row)]
+            for row in _ROW_RE.findall(table)
+        ]
+        if not rows:
+            continue
+        table_picks = _multi_round_picks_from_texts(rows[0], rows[1:], resolver)
+        if len(table_picks) > len(best_picks):
+            best_picks = table_picks
+
+    if len(best_picks) < _FULL_FIELD_TEAMS:
+        return {}
+    return best_picks
+
+
 def _parse_multi_round_pick_table_html(html: str, resolver) -> dict[str, dict[int, float]]:
     """Parse an HTML table with multiple advancement-percentage columns."""
-    soup = BeautifulSoup(html, "html.parser")
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
     best_picks: dict[str, dict[int, float]] = {}
 
-    for table in soup.find_all("table"):
+    for table in tree.css("table"):
         table_picks = _extract_multi_round_pick_rows_from_table(table, resolver)
         if len(table_picks) > len(best_picks):
             best_picks = table_picks
@@ -274,10 +360,12 @@ def _parse_multi_round_pick_table_html(html: str, resolver) -> dict[str, dict[in
 
 def _parse_pick_table_html(html: str, resolver, round_reaching: int | None) -> dict[str, dict[int, float]]:
     """Parse a generic HTML table of team pick percentages."""
-    soup = BeautifulSoup(html, "html.parser")
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
     best_rows: list[tuple[str, float]] = []
 
-    for table in soup.find_all("table"):
+    for table in tree.css("table"):
         parsed_rows = _extract_pick_rows_from_table(table, resolver)
         if len(parsed_rows) > len(best_rows):
             best_rows = parsed_rows
@@ -307,12 +395,12 @@ def _parse_article_pick_percentages(html: str,
 
 def _extract_pick_rows_from_table(table, resolver) -> list[tuple[str, float]]:
     """Extract (team, pct) rows from a table when possible."""
-    rows = table.find_all("tr")
+    rows = table.css("tr")
     if not rows:
         return []
 
-    header_cells = rows[0].find_all(["th", "td"])
-    headers = [_normalize_text(cell.get_text(" ", strip=True)).lower() for cell in header_cells]
+    header_cells = rows[0].css("th, td")
+    headers = [_normalize_text(cell.text(separator=" ", strip=True)).lower() for cell in header_cells]
 
     pct_idx = None
     team_idx = None
@@ -324,11 +412,11 @@ def _extract_pick_rows_from_table(table, resolver) -> list[tuple[str, float]]:
 
     parsed_rows: list[tuple[str, float]] = []
     for row in rows[1:]:
-        cells = row.find_all(["td", "th"])
+        cells = row.css("td, th")
         if len(cells) < 2:
             continue
 
-        texts = [_normalize_text(cell.get_text(" ", strip=True)) for cell in cells]
+        texts = [_normalize_text(cell.text(separator=" ", strip=True)) for cell in cells]
         pct = _parse_pct(texts[pct_idx]) if pct_idx is not None and pct_idx < len(texts) else None
         if pct is None:
             for text in texts:
@@ -362,12 +450,27 @@ def _extract_pick_rows_from_table(table, resolver) -> list[tuple[str, float]]:
 
 def _extract_multi_round_pick_rows_from_table(table, resolver) -> dict[str, dict[int, float]]:
     """Extract {team: {round: pct}} rows from a table with multiple % columns."""
-    rows = table.find_all("tr")
+    rows = table.css("tr")
     if not rows:
         return {}
 
-    header_cells = rows[0].find_all(["th", "td"])
-    headers = [_normalize_text(cell.get_text(" ", strip=True)).lower() for cell in header_cells]
+    header_texts = [_normalize_text(cell.text(separator=" ", strip=True)) for cell in rows[0].css("th, td")]
+    row_texts = [
+        [_normalize_text(cell.text(separator=" ", strip=True)) for cell in row.css("td, th")]
+        for row in rows[1:]
+    ]
+    return _multi_round_picks_from_texts(header_texts, row_texts, resolver)
+
+
+def _multi_round_picks_from_texts(header_texts: list[str],
+                                  row_texts: list[list[str]],
+                                  resolver) -> dict[str, dict[int, float]]:
+    """Map a multi-round pick table's cell texts to {team: {round: pct}}.
+
+    The team column is the first header mentioning "team"; every header with
+    a "%" or "pick" is an advancement column, read in order as rounds 2+.
+    """
+    headers = [text.lower() for text in header_texts]
 
     team_idx = None
     pct_indices = []
@@ -381,12 +484,10 @@ def _extract_multi_round_pick_rows_from_table(table, resolver) -> dict[str, dict
         return {}
 
     picks: dict[str, dict[int, float]] = {}
-    for row in rows[1:]:
-        cells = row.find_all(["td", "th"])
-        if len(cells) <= max(team_idx, max(pct_indices)):
+    for texts in row_texts:
+        if len(texts) <= max(team_idx, max(pct_indices)):
             continue
 
-        texts = [_normalize_text(cell.get_text(" ", strip=True)) for cell in cells]
         team_name = resolver(_clean_team_name(texts[team_idx]))
         if not team_name:
             continue
@@ -547,8 +648,7 @@ def _load_team_aliases() -> dict[str, str]:
     aliases_path = os.path.join(os.path.dirname(__file__), "..", "data", "team_aliases.json")
     if not os.path.exists(aliases_path):
         return {}
-    with open(aliases_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return read_json(aliases_path)
 
 
 def _resolve_espn_challenge_id(year: int, explicit_challenge_id: int | None) -> int | None:
@@ -710,6 +810,26 @@ def _normalize_text(text: str) -> str:
     return text.strip()
 
 
+def _load_cached_text(filename: str, refresh: bool = False) -> str | None:
+    """Return a raw file saved by an earlier fetch if it is still fresh."""
+    if refresh:
+        return None
+    from ingestion.http_session import read_fresh_cache
+
+    return read_fresh_cache(os.path.join(DATA_DIR, filename))
+
+
+def _load_cached_json(filename: str, refresh: bool = False):
+    """Like ``_load_cached_text`` but decodes the cached JSON payload."""
+    text = _load_cached_text(filename, refresh)
+    if text is None:
+        return None
+    try:
+        return loads(text)
+    except ValueError:
+        return None
+
+
 def _save_text(filename: str, text: str):
     """Save raw text/HTML for debugging."""
     os.makedirs(DATA_DIR, exist_ok=True)
@@ -722,21 +842,18 @@ def _save_json(filename: str, payload: dict):
     """Save raw JSON for debugging."""
     os.makedirs(DATA_DIR, exist_ok=True)
     path = os.path.join(DATA_DIR, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    write_json(path, payload)
 
 
 def save_picks(picks: dict[str, dict[int, float]], filepath: str):
     """Save parsed pick percentages to JSON."""
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     serializable = {name: {str(r): p for r, p in rpcts.items()} for name, rpcts in picks.items()}
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(serializable, f, indent=2)
+    write_json(filepath, serializable)
     print(f"Saved pick percentages to {filepath}")
 
 
 def load_picks(filepath: str) -> dict[str, dict[int, float]]:
     """Load previously saved pick percentages from JSON."""
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(filepath)
     return {name: {int(r): p for r, p in rpcts.items()} for name, rpcts in data.items()}
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import config
 from ingestion.manual_entry import load_ratings_from_csv
 from optimizer.rating_utils import build_consensus_ratings
@@ -10,16 +12,30 @@ from optimizer.rating_utils import build_consensus_ratings
 def fetch_ratings_from_source(source: str,
                               year: int = 2026,
                               save: bool = True,
-                              file: str | None = None) -> dict[str, dict]:
-    """Fetch or load team ratings from a named source."""
+                              file: str | None = None,
+                              refresh: bool = False) -> dict[str, dict]:
+    """Fetch or load team ratings from a named source.
+
+    ``refresh`` bypasses the raw page cache for scraped sources (ESPN BPI).
+    """
     source = source.strip().lower()
 
     if source == "consensus":
+        # Component fetches are independent network calls; run them side by side.
+        components = list(config.RATING_SOURCE_WEIGHTS)
+        with ThreadPoolExecutor(max_workers=min(4, len(components))) as pool:
+            futures = {
+                component: pool.submit(
+                    fetch_ratings_from_source, component, year=year, save=save, file=None, refresh=refresh
+                )
+                for component in components
+            }
+
         ratings_by_source = {}
         errors = []
-        for component in config.RATING_SOURCE_WEIGHTS:
+        for component, future in futures.items():
             try:
-                ratings = fetch_ratings_from_source(component, year=year, save=save, file=None)
+                ratings = future.result()
             except Exception as exc:
                 errors.append(f"{component}={exc}")
                 continue
@@ -48,7 +64,7 @@ def fetch_ratings_from_source(source: str,
     if source == "espn":
         from ingestion.espn_bpi import fetch_espn_bpi, bpi_to_rating
 
-        raw = fetch_espn_bpi()
+        raw = fetch_espn_bpi(save=save, refresh=refresh)
         ratings = {}
         for name, data in raw.items():
             ratings[name] = {
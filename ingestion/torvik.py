@@ -7,10 +7,19 @@ The CSV contains ~360 teams with columns including:
 - Adjusted offensive/defensive efficiency (adjoe, adjde)
 """
 
+from io import BytesIO
 import os
+
+import numpy as np
 import pandas as pd
 import requests
 
+try:
+    import pyarrow  # noqa: F401  (enables pandas' Arrow CSV engine)
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
+
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data", "raw")
 TORVIK_URLS = [
     "https://barttorvik.com/{year}_team_results.csv",
@@ -51,19 +60,16 @@ def fetch_torvik_ratings(year: int = 2026, save: bool = True) -> pd.DataFrame:
         assert last_error is not None
         raise last_error
 
-    # Save raw CSV
+    # Save the raw bytes and parse them in place; no decoded text copy.
+    data = resp.content
     os.makedirs(DATA_DIR, exist_ok=True)
     csv_path = os.path.join(DATA_DIR, f"torvik_{year}.csv")
     if save:
-        with open(csv_path, "w", encoding="utf-8") as f:
-            f.write(resp.text)
+        with open(csv_path, "wb") as f:
+            f.write(data)
         print(f"Saved to {csv_path}")
 
-    # Parse into DataFrame
-    from io import StringIO
-    df = pd.read_csv(StringIO(resp.text))
-
-    return df
+    return pd.read_csv(BytesIO(data), engine=_CSV_ENGINE)
 
 
 def parse_torvik_ratings(df: pd.DataFrame) -> dict[str, dict]:
@@ -72,8 +78,6 @@ def parse_torvik_ratings(df: pd.DataFrame) -> dict[str, dict]:
     Returns:
         {team_name: {"rating": barthag, "adj_offense": adjoe, "adj_defense": adjde, ...}}
     """
-    ratings = {}
-
     # Column names vary slightly by year; find them flexibly
     team_col = _find_col(df, ["team", "Team"])
     barthag_col = _find_col(df, ["barthag", "Barthag", "BARTHAG"])
@@ -86,32 +90,65 @@ def parse_torvik_ratings(df: pd.DataFrame) -> dict[str, dict]:
         print("Warning: Could not find expected columns. Using positional fallback.")
         print(f"Available columns: {list(df.columns)}")
         # Torvik CSV typically: rank, team, conf, record, adjoe, adjde, barthag, ...
-        for _, row in df.iterrows():
-            try:
-                name = str(row.iloc[1]).strip()
-                ratings[name] = {
-                    "rating": float(row.iloc[6]) if len(row) > 6 else 0.5,
-                    "adj_offense": float(row.iloc[4]) if len(row) > 4 else 100.0,
-                    "adj_defense": float(row.iloc[5]) if len(row) > 5 else 100.0,
-                    "conference": str(row.iloc[2]).strip() if len(row) > 2 else "",
-                }
-            except (ValueError, IndexError):
-                continue
-        return ratings
-
-    for _, row in df.iterrows():
-        name = str(row[team_col]).strip()
-        try:
-            ratings[name] = {
-                "rating": float(row[barthag_col]),
-                "adj_offense": float(row[adjoe_col]) if adjoe_col else 100.0,
-                "adj_defense": float(row[adjde_col]) if adjde_col else 100.0,
-                "conference": str(row[conf_col]).strip() if conf_col else "",
-            }
-        except (ValueError, TypeError):
-            continue
-
-    return ratings
+        n_cols = df.shape[1]
+        if n_cols < 2:
+            return {}
+        return _build_ratings(
+            names=df.iloc[:, 1],
+            barthag=df.iloc[:, 6] if n_cols > 6 else None,
+            adjoe=df.iloc[:, 4] if n_cols > 4 else None,
+            adjde=df.iloc[:, 5] if n_cols > 5 else None,
+            confs=df.iloc[:, 2] if n_cols > 2 else None,
+        )
+
+    return _build_ratings(
+        names=df[team_col],
+        barthag=df[barthag_col],
+        adjoe=df[adjoe_col] if adjoe_col else None,
+        adjde=df[adjde_col] if adjde_col else None,
+        confs=df[conf_col] if conf_col else None,
+    )
+
+
+def _build_ratings(names: pd.Series,
+                   barthag: pd.Series | None,
+                   adjoe: pd.Series | None,
+                   adjde: pd.Series | None,
+                   confs: pd.Series | None) -> dict[str, dict]:
+    """Assemble the ratings dict from whole columns.
+
+    Missing columns take their defaults; rows with a non-numeric or empty
+    rating/efficiency value are dropped.
+    """
+    n_rows = len(names)
+    rating = _numeric_array(barthag, 0.5, n_rows)
+    offense = _numeric_array(adjoe, 100.0, n_rows)
+    defense = _numeric_array(adjde, 100.0, n_rows)
+    keep = ~(np.isnan(rating) | np.isnan(offense) | np.isnan(defense))
+
+    team_names = names.astype(str).str.strip().to_numpy()[keep].tolist()
+    if confs is not None:
+        conferences = confs.astype(str).str.strip().to_numpy()[keep].tolist()
+    else:
+        conferences = [""] * len(team_names)
+
+    return {
+        name: {"rating": r, "adj_offense": o, "adj_defense": d, "conference": c}
+        for name, r, o, d, c in zip(
+            team_names,
+            rating[keep].tolist(),
+            offense[keep].tolist(),
+            defense[keep].tolist(),
+            conferences,
+        )
+    }
+
+
+def _numeric_array(column: pd.Series | None, default: float, n_rows: int) -> np.ndarray:
+    """Coerce a column to float64 (non-numeric -> NaN), or fill with ``default``."""
+    if column is None:
+        return np.full(n_rows, default)
+    return pd.to_numeric(column, errors="coerce").to_numpy(dtype=np.float64)
 
 
 def _find_col(df: pd.DataFrame, candidates: list[str]) -> str | None:
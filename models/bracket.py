@@ -21,15 +21,48 @@ Slot 0: seed 1, Slot 1: seed 16, Slot 2: seed 8, Slot 3: seed 9,
 Slot 4: seed 5, Slot 5: seed 12, Slot 6: seed 4, Slot 7: seed 13,
 Slot 8: seed 6, Slot 9: seed 11, Slot 10: seed 3, Slot 11: seed 14,
 Slot 12: seed 7, Slot 13: seed 10, Slot 14: seed 2, Slot 15: seed 15
+
+``slot_ids`` mirrors ``slots`` as an int8 array of team ids (indices into
+``teams``, -1 for empty) so hot loops can compare brackets with array ops.
+Brackets copied from the same base share one id space.
 """
 
 from __future__ import annotations
 
+import numpy as np
+
 from models.team import Team
 
 # Seeds placed in bracket order within a region (matches standard bracket layout)
 SEED_ORDER = [1, 16, 8, 9, 5, 12, 4, 13, 6, 11, 3, 14, 7, 10, 2, 15]
 
+# Round (1-6) of each game slot 1-63; index 0 is unused. A slot's depth in
+# the tree is its bit length, so round = 7 - depth.
+SLOT_ROUND = np.array([0] + [7 - slot.bit_length() for slot in range(1, 64)], dtype=np.int8)
+_SLOT_ROUND_LIST = SLOT_ROUND.tolist()
+
+# dtype of ``slot_ids`` and every id array derived from it. Ids fit in a
+# byte, which keeps (n_sims, 128) sim arrays small.
+SLOT_ID_DTYPE = np.int8
+MAX_TEAMS = np.iinfo(SLOT_ID_DTYPE).max
+
+# The tree shape never changes, so the rest of its layout is fixed too.
+# Game slots of each round 1-6, in bracket order.
+ROUND_GAME_SLOTS = {
+    round_num: tuple(range(1 << (6 - round_num), 1 << (7 - round_num))) for round_num in range(1, 7)
+}
+# (game_slot, left_child, right_child) for every game of each round 1-6.
+ROUND_MATCHUPS = {
+    round_num: tuple((slot, 2 * slot, 2 * slot + 1) for slot in game_slots)
+    for round_num, game_slots in ROUND_GAME_SLOTS.items()
+}
+# Region (0-3) of each slot 0-127; None for the Final Four and Championship.
+REGION_OF_SLOT = tuple(
+    None if slot <= 3 else (slot >> (slot.bit_length() - 3)) - 4 for slot in range(128)
+)
+# Game slots a team must win from each starting slot 64-127, first game first.
+PATHS = {slot: tuple(slot >> k for k in range(1, 7)) for slot in range(64, 128)}
+
 
 class Bracket:
     """A 64-team tournament bracket."""
@@ -37,8 +70,30 @@ class Bracket:
     def __init__(self):
         # slots[0] is unused. slots[1..63] are game results. slots[64..127] are starting teams.
         self.slots: list[Team | None] = [None] * 128
+        self.slot_ids: np.ndarray = np.full(128, -1, dtype=SLOT_ID_DTYPE)
         self.regions: dict[int, str] = {}  # region_index (0-3) -> region name
-        self.teams: list[Team] = []  # all 64 teams
+        self.teams: list[Team] = []  # all 64 teams; a team's id is its index here
+        self._team_ids: dict[Team, int] = {}
+        self._start_slot: dict[Team, int] = {}
+        # Per-team attributes indexed by team id, for the id-based hot paths.
+        self.ratings: np.ndarray = np.empty(0, dtype=np.float64)
+        self.seeds: np.ndarray = np.empty(0, dtype=np.int64)
+
+    def __setstate__(self, state: dict):
+        # Brackets pickled before slot_ids existed rebuild the id view on load.
+        self.__dict__.update(state)
+        if "slot_ids" not in state:
+            self._team_ids = {team: i for i, team in enumerate(self.teams)}
+            self.slot_ids = self.ids_of(self.slots)
+        elif self.slot_ids.dtype != SLOT_ID_DTYPE:
+            self.slot_ids = self.slot_ids.astype(SLOT_ID_DTYPE)
+        if "_start_slot" not in state:
+            self._start_slot = {
+                self.slots[slot]: slot for slot in range(64, 128) if self.slots[slot] is not None
+            }
+        if "ratings" not in state:
+            self.ratings = np.fromiter((t.rating for t in self.teams), dtype=np.float64, count=len(self.teams))
+            self.seeds = np.fromiter((t.seed for t in self.teams), dtype=np.int64, count=len(self.teams))
 
     def set_team(self, region_index: int, seed_position: int, team: Team):
         """Place a team into its starting slot.
@@ -49,9 +104,21 @@ class Bracket:
         """
         base = 64 + region_index * 16
         slot = base + seed_position
-        self.slots[slot] = team
-        if team not in self.teams:
+        team_id = self._team_ids.get(team)
+        if team_id is None:
+            team_id = len(self.teams)
+            if team_id >= MAX_TEAMS:
+                raise ValueError(f"A bracket holds at most {MAX_TEAMS} distinct teams")
             self.teams.append(team)
+            self._team_ids[team] = team_id
+            self.ratings = np.append(self.ratings, team.rating)
+            self.seeds = np.append(self.seeds, team.seed)
+        previous = self.slots[slot]
+        if previous is not None and self._start_slot.get(previous) == slot:
+            del self._start_slot[previous]
+        self.slots[slot] = team
+        self.slot_ids[slot] = team_id
+        self._start_slot[team] = slot
 
     def set_teams_for_region(self, region_index: int, region_name: str, teams_by_seed: dict[int, Team]):
         """Place all 16 teams for a region.
@@ -74,9 +141,24 @@ class Bracket:
         """Get the team at a slot (either a starting slot or a game winner)."""
         return self.slots[slot]
 
-    def set_winner(self, game_slot: int, team: Team):
+    def set_winner(self, game_slot: int, team: Team | None):
         """Set the winner of a game slot."""
         self.slots[game_slot] = team
+        self.slot_ids[game_slot] = self._team_ids.get(team, -1)
+
+    @property
+    def starting_ids(self) -> np.ndarray:
+        """Team ids in the 64 starting slots (a view of ``slot_ids[64:]``)."""
+        return self.slot_ids[64:]
+
+    def team_id(self, team: Team | None) -> int:
+        """Get a team's id (index into ``teams``), or -1 if it isn't in this bracket."""
+        return self._team_ids.get(team, -1)
+
+    def ids_of(self, slots: list[Team | None]) -> np.ndarray:
+        """Convert a slot list (e.g. from ``simulate_once_flat``) to a ``slot_ids``-style id array."""
+        team_ids = self._team_ids
+        return np.fromiter((team_ids.get(team, -1) for team in slots), dtype=SLOT_ID_DTYPE, count=len(slots))
 
     def get_round(self, game_slot: int) -> int:
         """Get the round number (1-6) for a game slot.
@@ -90,61 +172,30 @@ class Bracket:
         """
         if game_slot < 1 or game_slot > 63:
             raise ValueError(f"Invalid game slot: {game_slot}")
-        r = 0
-        s = game_slot
-        while s >= 1:
-            r += 1
-            s //= 2
-        # r is now the depth from root +1. Invert: round = 7 - depth
-        return 7 - r
+        return _SLOT_ROUND_LIST[game_slot]
 
     def get_region_index(self, slot: int) -> int | None:
         """Get which region (0-3) a slot belongs to. None for Final Four / Championship."""
-        if slot <= 3:
-            return None  # Final Four or Championship
-        while slot >= 8:
-            slot //= 2
-        # slot is now 4, 5, 6, or 7
-        return slot - 4
-
-    def get_all_game_slots_for_round(self, round_num: int) -> list[int]:
+        return REGION_OF_SLOT[slot]
+
+    def get_all_game_slots_for_round(self, round_num: int) -> tuple[int, ...]:
         """Get all game slot indices for a given round."""
-        if round_num == 6:
-            return [1]
-        if round_num == 5:
-            return [2, 3]
-        if round_num == 4:
-            return [4, 5, 6, 7]
-        if round_num == 3:
-            return list(range(8, 16))
-        if round_num == 2:
-            return list(range(16, 32))
-        if round_num == 1:
-            return list(range(32, 64))
-        return []
-
-    def get_path_to_championship(self, starting_slot: int) -> list[int]:
+        return ROUND_GAME_SLOTS.get(round_num, ())
+
+    def get_path_to_championship(self, starting_slot: int) -> tuple[int, ...]:
         """Get the game slots a team must win to become champion.
 
         Args:
             starting_slot: The team's starting slot (64-127)
 
         Returns:
-            List of game slot indices from first game to championship [32+, 16+, 8+, 4+, 2-3, 1]
+            Game slot indices from first game to championship (32+, 16+, 8+, 4+, 2-3, 1)
         """
-        path = []
-        slot = starting_slot // 2
-        while slot >= 1:
-            path.append(slot)
-            slot //= 2
-        return path
+        return PATHS[starting_slot]
 
     def get_starting_slot(self, team: Team) -> int | None:
         """Find the starting slot (64-127) for a team."""
-        for i in range(64, 128):
-            if self.slots[i] == team:
-                return i
-        return None
+        return self._start_slot.get(team)
 
     def get_opponent_slot(self, game_slot: int, team_slot: int) -> int:
         """Given a game slot and one team's incoming slot, get the opponent's incoming slot."""
@@ -153,18 +204,43 @@ class Bracket:
 
     def get_teams_in_subtree(self, slot: int) -> list[Team]:
         """Get all teams that could potentially reach this game slot."""
-        if slot >= 64:
-            team = self.slots[slot]
-            return [team] if team else []
-        left, right = self.get_matchup(slot)
-        return self.get_teams_in_subtree(left) + self.get_teams_in_subtree(right)
+        lo, hi = self.get_leaf_range(slot)
+        return [team for team in self.slots[lo:hi] if team]
+
+    def get_leaf_range(self, slot: int) -> tuple[int, int]:
+        """Get the half-open range of starting slots (64-127) under a slot.
+
+        A slot at depth d (bit length - 1) sits 6 - d levels above the
+        leaves, so its leaves are [slot << k, (slot + 1) << k).
+        """
+        k = 7 - slot.bit_length()
+        return slot << k, (slot + 1) << k
+
+    def iter_possible_matchups(self):
+        """Yield (game_slot, round_num, team_a, team_b) for every pairing that can occur.
+
+        ``team_a`` comes from the left subtree and ``team_b`` from the right.
+        """
+        for game_slot in range(1, 64):
+            round_num = _SLOT_ROUND_LIST[game_slot]
+            left, right = self.get_matchup(game_slot)
+            right_teams = self.get_teams_in_subtree(right)
+            for team_a in self.get_teams_in_subtree(left):
+                for team_b in right_teams:
+                    yield game_slot, round_num, team_a, team_b
 
     def copy(self) -> Bracket:
         """Create a deep copy of this bracket."""
         new = Bracket()
         new.slots = list(self.slots)
+        new.slot_ids = self.slot_ids.copy()
         new.regions = dict(self.regions)
         new.teams = list(self.teams)
+        new._team_ids = dict(self._team_ids)
+        new._start_slot = dict(self._start_slot)
+        # set_team replaces rather than mutates these arrays, so sharing is safe.
+        new.ratings = self.ratings
+        new.seeds = self.seeds
         return new
 
     def is_complete(self) -> bool:
@@ -1,5 +1,7 @@
 """Win probability calculations."""
 
+import numpy as np
+
 
 def log5(rating_a: float, rating_b: float) -> float:
     """Compute P(A beats B) using the Log5 method.
@@ -18,3 +20,21 @@ def log5(rating_a: float, rating_b: float) -> float:
     if den == 0:
         return 0.5
     return num / den
+
+
+def log5_matrix(ratings: np.ndarray) -> np.ndarray:
+    """Compute ``log5`` for every ordered pair of ratings at once.
+
+    Args:
+        ratings: 1-D array of power ratings (0-1)
+
+    Returns:
+        Square array where ``[a, b]`` = P(team a beats team b); pairs whose
+        Log5 denominator is zero get 0.5, as in ``log5``.
+    """
+    ratings = np.asarray(ratings, dtype=np.float64)
+    num = ratings[:, None] * (1 - ratings)[None, :]
+    den = num + ratings[None, :] * (1 - ratings)[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        table = np.where(den == 0, 0.5, num / den)
+    return table
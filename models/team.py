@@ -1,9 +1,9 @@
 """Team data model."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
 
-@dataclass
+@dataclass(frozen=True, eq=False, slots=True)
 class Team:
     name: str
     seed: int
@@ -15,14 +15,33 @@ class Team:
     reach_probs: dict[int, float] = field(default_factory=dict)
     # Public pick percentages by round: {round_num: fraction}
     pick_pcts: dict[int, float] = field(default_factory=dict)
+    # Identity hash, computed once; teams are dict/set keys throughout the optimizer.
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_hash", hash((self.name, self.seed, self.region)))
 
     def __str__(self):
         return f"({self.seed}) {self.name}"
 
     def __hash__(self):
-        return hash((self.name, self.seed, self.region))
+        return self._hash
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Team):
             return False
         return self.name == other.name and self.seed == other.seed and self.region == other.region
+
+    def __getstate__(self):
+        # str hashes are salted per process, so _hash is recomputed on load.
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+
+    def __setstate__(self, state: dict):
+        # Also accepts the __dict__ of Teams pickled before the class used slots.
+        for f in fields(self):
+            if f.init:
+                default = f.default_factory() if callable(f.default_factory) else f.default
+                object.__setattr__(self, f.name, state.get(f.name, default))
+        self.__post_init__()
@@ -0,0 +1,54 @@
+"""GPU tournament simulation for ``optimizer.simulator``, via CuPy.
+
+Runs the same per-round ``where`` blend as ``simulate_many_ids`` on CuPy
+arrays, so very large sim counts stay on the device and only the final
+reach counts come back to the host. CuPy is optional: without it
+``HAVE_CUPY`` is False and only the NumPy backend is available.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    import cupy as cp
+    HAVE_CUPY = True
+except ImportError:
+    cp = None
+    HAVE_CUPY = False
+
+
+def count_reaches_cuda(start_ids: np.ndarray, win_probs: np.ndarray, n_sims: int,
+                       seed: int | None, chunk: int) -> np.ndarray:
+    """Simulate ``n_sims`` tournaments on the GPU and return their reach counts.
+
+    Same layout as ``simulator._count_reaches``: ``[i, r]`` = sims in which
+    team id i reached round r (1-7). Sims run ``chunk`` at a time to bound
+    device memory.
+    """
+    n_teams = win_probs.shape[1]
+    rng = cp.random.default_rng(seed)
+    probs = cp.asarray(win_probs, dtype=cp.float32)
+    start = cp.asarray(start_ids)
+
+    counts = cp.zeros((n_teams, 8), dtype=cp.int64)
+    counts[:, 1] = n_sims  # everyone starts in round 1
+    for offset in range(0, n_sims, chunk):
+        size = min(chunk, n_sims - offset)
+        slots = cp.empty((128, size), dtype=start.dtype)
+        slots[:] = start[:, None]
+        draws = rng.random((63, size), dtype=cp.float32)
+
+        for round_num in range(1, 7):
+            lo, hi = 1 << (6 - round_num), 1 << (7 - round_num)  # game slots of this round
+            left = slots[2 * lo:2 * hi:2]
+            right = slots[2 * lo + 1:2 * hi:2]
+            p_left = probs[round_num][left, right]
+            # A missing side forfeits to whichever team is present.
+            take_left = (right < 0) | ((left >= 0) & (draws[lo - 1:hi - 1] < p_left))
+            slots[lo:hi] = cp.where(take_left, left, right)
+
+            winners = slots[lo:hi].ravel()
+            counts[:, round_num + 1] += cp.bincount(winners[winners >= 0], minlength=n_teams)
+
+    return cp.asnumpy(counts)
@@ -0,0 +1,50 @@
+"""Compiled, multi-threaded tournament simulation for ``optimizer.simulator``.
+
+Plays many tournaments on int8 team-id arrays (see ``Bracket.slot_ids``)
+with Numba, one block of sims per ``prange`` iteration. Numba is optional: without it
+``HAVE_NUMBA`` is False and the simulator keeps its NumPy path.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from optimizer._validate_kernel import HAVE_NUMBA, _fill_bracket, njit
+
+try:
+    from numba import prange
+except ImportError:
+    prange = range
+
+
+# Sims per independently seeded block. Fixed, so a given seed produces the
+# same tournaments whatever the thread count.
+SIM_BLOCK = 1024
+
+
+def progress_counter(n_sims: int) -> np.ndarray:
+    """Zeroed per-block progress array for ``run_sims``; its sum is the sims finished."""
+    return np.zeros((n_sims + SIM_BLOCK - 1) // SIM_BLOCK, dtype=np.int64)
+
+
+@njit(cache=True, parallel=True, nogil=True)
+def run_sims(start_ids, win_prob, slot_round, n_sims, seed, progress):
+    """Simulate ``n_sims`` tournaments; row ``k`` is sim ``k``'s 128-slot id array.
+
+    Sims run in ``SIM_BLOCK``-sized blocks, one block per ``prange``
+    iteration. Each block reseeds its thread's stream with ``seed + block``,
+    so results depend only on ``seed``, not on how blocks land on threads.
+    Block ``b`` counts its finished sims in ``progress[b]`` (see
+    ``progress_counter``), which a host thread can poll; each slot has a
+    single writer, so no updates are lost.
+    """
+    out = np.empty((n_sims, 128), dtype=np.int8)
+    n_blocks = (n_sims + SIM_BLOCK - 1) // SIM_BLOCK
+    for block in prange(n_blocks):
+        np.random.seed(seed + block)
+        stop = min((block + 1) * SIM_BLOCK, n_sims)
+        for k in range(block * SIM_BLOCK, stop):
+            out[k, 0] = -1
+            _fill_bracket(start_ids, win_prob, slot_round, out[k])
+            progress[block] += 1
+    return out
@@ -0,0 +1,99 @@
+"""Compiled Monte Carlo validation loop for ``optimizer.engine._validate``.
+
+Everything here works on int8 team-id arrays (see ``Bracket.slot_ids``) and
+per-round probability tables, so the per-sim scoring loop can be compiled
+with Numba. The engine draws the tournaments and the shared opponent pool
+itself, so compiled and pure-Python validation score the same brackets.
+Numba is optional: without it ``HAVE_NUMBA`` is False and the engine keeps
+its pure-Python loop.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+UPSET_NONE = 0
+UPSET_MULTIPLIER = 1
+UPSET_FIXED = 2
+
+
+@njit(cache=True)
+def _fill_bracket(start_ids, prob_table, slot_round, out):
+    """Play every game bottom-up; ``prob_table[r, a, b]`` = P(a advances over b)."""
+    for slot in range(64, 128):
+        out[slot] = start_ids[slot]
+    for slot in range(63, 0, -1):
+        a = out[2 * slot]
+        b = out[2 * slot + 1]
+        if a < 0 or b < 0:
+            out[slot] = a if a >= 0 else b
+        elif np.random.random() < prob_table[slot_round[slot], a, b]:
+            out[slot] = a
+        else:
+            out[slot] = b
+
+
+@njit(cache=True)
+def _score(pick_ids, actual, slot_round, round_points, seeds, upset_mode, upset_values):
+    """Same points as ``scorer.score_bracket`` for id arrays."""
+    total = 0.0
+    for slot in range(1, 64):
+        winner = actual[slot]
+        if winner < 0 or pick_ids[slot] != winner:
+            continue
+        round_num = slot_round[slot]
+        points = round_points[round_num]
+        a = actual[2 * slot]
+        b = actual[2 * slot + 1]
+        if upset_mode != UPSET_NONE and a >= 0 and b >= 0:
+            loser = b if winner == a else a
+            seed_diff = seeds[winner] - seeds[loser]
+            if seed_diff > 0:
+                if upset_mode == UPSET_MULTIPLIER:
+                    points += seed_diff * upset_values[round_num]
+                else:
+                    points += upset_values[round_num]
+        total += points
+    return total
+
+
+@njit(cache=True)
+def validate_kernel(pick_ids, actual_rows, opp_pool, opp_draws, slot_round,
+                    round_points, seeds, upset_mode, upset_values):
+    """Return (pool wins, total score) for ``pick_ids`` over the sims in ``actual_rows``.
+
+    Row ``k`` of ``actual_rows`` is sim ``k``'s tournament, and row ``k`` of
+    ``opp_draws`` holds the indices into ``opp_pool`` of that sim's opponents.
+    """
+    wins = 0.0
+    total_score = 0.0
+
+    for k in range(actual_rows.shape[0]):
+        actual = actual_rows[k]
+        my_score = _score(pick_ids, actual, slot_round, round_points, seeds, upset_mode, upset_values)
+        total_score += my_score
+
+        max_opp_score = 0.0
+        for j in range(opp_draws.shape[1]):
+            opp = opp_pool[opp_draws[k, j]]
+            opp_score = _score(opp, actual, slot_round, round_points, seeds, upset_mode, upset_values)
+            if opp_score > max_opp_score:
+                max_opp_score = opp_score
+
+        if my_score > max_opp_score:
+            wins += 1.0
+        elif my_score == max_opp_score:
+            wins += 0.5
+
+    return wins, total_score
@@ -8,6 +8,7 @@ The goal is to maximize the probability of winning a small family pool,
 not just maximizing expected points.
 """
 
+from functools import lru_cache
 from itertools import product
 import math
 
@@ -15,13 +16,21 @@ import numpy as np
 from tqdm import tqdm
 
 import config
-from models.bracket import Bracket
-from models.probability import log5
+from models.bracket import Bracket, SLOT_ID_DTYPE, SLOT_ROUND
+from models.probability import log5, log5_matrix
 from models.team import Team
-from optimizer.pick_utils import get_matchup_pick_prob, get_round_pick_pct
-from optimizer.scorer import score_bracket, compute_game_points
-from optimizer.simulator import simulate_once_flat
-from optimizer.pool_model import generate_opponent_bracket
+from optimizer.pick_utils import build_pick_pct_table
+from optimizer.reach_prob_utils import build_reach_table
+from optimizer.scorer import score_bracket_ids, score_pick_ids_batch, compute_game_points
+from optimizer.simulator import build_win_prob_table, simulate_many_flat, simulate_many_ids
+from optimizer.pool_model import build_pick_prob_table, generate_opponent_ids, generate_opponent_ids_batch
+from optimizer._validate_kernel import (
+    HAVE_NUMBA,
+    UPSET_FIXED,
+    UPSET_MULTIPLIER,
+    UPSET_NONE,
+    validate_kernel,
+)
 
 LATE_ROUND_SLOTS = (4, 5, 6, 7, 2, 3, 1)
 LATE_ROUND_NUMBERS = {4: 4, 5: 4, 6: 4, 7: 4, 2: 5, 3: 5, 1: 6}
@@ -62,6 +71,14 @@ def optimize(bracket: Bracket,
     rng = np.random.default_rng(seed)
     result = bracket.copy()
 
+    # Every game odds lookup below comes from this table, built once per field.
+    log5_table = log5_matrix(bracket.ratings)
+    win_probs = build_win_prob_table(bracket, log5_table)
+    pick_probs = build_pick_prob_table(bracket, pick_pcts, log5_table)
+    # Reach and public pick rates by team id, replacing per-pick dict lookups.
+    reach_table = build_reach_table(bracket.teams, reach_probs)
+    pick_table = build_pick_pct_table(bracket.teams, pick_pcts)
+
     def _print(msg):
         if not quiet:
             print(msg)
@@ -70,7 +87,8 @@ def optimize(bracket: Bracket,
     _print("\n=== Phase 1: Optimizing Final Four and Championship ===")
     late_round_config = _optimize_late_rounds(
         bracket, reach_probs, pick_pcts, pool_size, accuracy_weight,
-        rng, n_sims, force_champion, rp, quiet, upset_mode, upset_values
+        rng, n_sims, force_champion, rp, quiet, upset_mode, upset_values,
+        win_probs, reach_table, pick_table, pick_probs
     )
 
     champion, f4_teams, semi_winners = late_round_config
@@ -81,7 +99,7 @@ def optimize(bracket: Bracket,
     _print("\n=== Phase 2: Filling bracket ===")
     result = _fill_bracket_forward(
         result, champion, f4_teams, semi_winners,
-        reach_probs, pick_pcts, pool_size, accuracy_weight, rp,
+        reach_table, pick_table, pool_size, accuracy_weight, rp,
         upset_mode, upset_values
     )
 
@@ -89,7 +107,7 @@ def optimize(bracket: Bracket,
     _print(f"\n=== Phase 3: Validating ({n_sims} simulations) ===")
     win_rate, avg_score = _validate(
         result, bracket, pick_pcts, pool_size, n_sims, rng, rp, quiet,
-        upset_mode, upset_values
+        upset_mode, upset_values, win_probs, pick_probs
     )
 
     max_score = sum(config.GAMES_PER_ROUND[r] * rp[r] for r in range(1, 7))
@@ -104,9 +122,20 @@ def optimize(bracket: Bracket,
 def _optimize_late_rounds(bracket, reach_probs, pick_pcts, pool_size,
                           accuracy_weight, rng, n_sims, force_champion,
                           round_points=None, quiet=False,
-                          upset_mode=None, upset_values=None):
+                          upset_mode=None, upset_values=None,
+                          win_probs=None, reach_table=None, pick_table=None,
+                          pick_probs=None):
     """Exhaustive search over Final Four + Championship combinations."""
     rp = round_points or config.ROUND_POINTS
+    if reach_table is None:
+        reach_table = build_reach_table(bracket.teams, reach_probs)
+    if pick_table is None:
+        pick_table = build_pick_pct_table(bracket.teams, pick_pcts)
+    if pick_probs is None:
+        pick_probs = build_pick_prob_table(bracket, pick_pcts)
+    team_id = bracket.team_id
+    reach_rows = reach_table.tolist()
+    pick_rows = pick_table.tolist()
 
     def _print(msg):
         if not quiet:
@@ -121,7 +150,7 @@ def _optimize_late_rounds(bracket, reach_probs, pick_pcts, pool_size,
             team = bracket.slots[base + pos]
             if team:
                 # Score by probability of reaching Final Four (round 5)
-                p_f4 = reach_probs.get(team.name, {}).get(5, 0.0)
+                p_f4 = reach_rows[team_id(team)][5]
                 region_teams.append((team, p_f4))
 
         region_teams.sort(key=lambda x: x[1], reverse=True)
@@ -131,13 +160,13 @@ def _optimize_late_rounds(bracket, reach_probs, pick_pcts, pool_size,
     # Pre-simulate tournaments for fast, path-aware late-round evaluation
     pre_sims = min(1000, n_sims)
     _print(f"  Pre-simulating {pre_sims} tournaments for evaluation (pass 1)...")
-    sim_results = [simulate_once_flat(bracket, rng) for _ in range(pre_sims)]
+    sim_results = simulate_many_flat(bracket, rng, pre_sims, win_probs)
     slot_candidates = _build_late_round_slot_candidates(candidates_per_region)
     score_cache = _precompute_late_round_scores(
         sim_results, slot_candidates, rp, upset_mode, upset_values
     )
     opp_max_scores = _precompute_opponent_late_round_scores(
-        bracket, pick_pcts, pool_size, sim_results, rng, rp, upset_mode, upset_values
+        bracket, pick_probs, pool_size, sim_results, rng, rp, upset_mode, upset_values
     )
 
     # Enumerate all F4 combos x semifinal winners x champion
@@ -145,39 +174,82 @@ def _optimize_late_rounds(bracket, reach_probs, pick_pcts, pool_size,
     all_scored: list[tuple[tuple, tuple]] = []  # (score, config)
     total_combos = 0
 
-    for f4 in product(*candidates_per_region):
-        if force_champion and not any(t.name == force_champion for t in f4):
-            continue
+    # The heuristic EMV of a combo is a sum of per-pick terms that each depend
+    # on one team or one matchup, so compute every term once up front.
+    f4_emv = {
+        team: _f4_pick_emv(team_id(team), reach_rows, pick_rows, pool_size, accuracy_weight, rp)
+        for region in candidates_per_region
+        for team in region
+    }
+    semi_emv: dict[tuple[Team, Team], tuple[float, float]] = {}
+    champ_terms: dict[tuple[Team, Team], tuple[float, float, float]] = {}
+    for left, right in ((0, 1), (2, 3)):
+        for team_a, team_b in product(candidates_per_region[left], candidates_per_region[right]):
+            for winner, loser in ((team_a, team_b), (team_b, team_a)):
+                semi_emv[winner, loser] = _semifinal_pick_emv(
+                    winner, loser, team_id(winner), team_id(loser), reach_rows, pick_rows,
+                    pool_size, accuracy_weight, rp,
+                    upset_mode, upset_values
+                )
+    for team_a, team_b in product(
+        _unique_teams(candidates_per_region[0] + candidates_per_region[1]),
+        _unique_teams(candidates_per_region[2] + candidates_per_region[3]),
+    ):
+        for winner, loser in ((team_a, team_b), (team_b, team_a)):
+            champ_terms[winner, loser] = _championship_pick_terms(
+                winner, loser, team_id(winner), team_id(loser), pick_rows, rp,
+                upset_mode, upset_values
+            )
+
+    combos: list[tuple] = []
+    sim_scores: list[tuple[float, float]] = []
+    partial_emv: list[float] = []
+    champ_probs: list[float] = []
+    champ_picks: list[float] = []
+    champ_points: list[float] = []
+    for f4 in _f4_combos(candidates_per_region, force_champion):
+        f4_total = 0.0
+        for team in f4:
+            f4_total += f4_emv[team]
 
         # Semifinal 1: region 0 vs region 1
         for semi1_winner in [f4[0], f4[1]]:
             semi1_loser = f4[1] if semi1_winner == f4[0] else f4[0]
+            semi1_emv, p_semi1_win = semi_emv[semi1_winner, semi1_loser]
             # Semifinal 2: region 2 vs region 3
             for semi2_winner in [f4[2], f4[3]]:
                 semi2_loser = f4[3] if semi2_winner == f4[2] else f4[2]
+                semi2_emv, p_semi2_win = semi_emv[semi2_winner, semi2_loser]
                 for champ in [semi1_winner, semi2_winner]:
                     if force_champion and champ.name != force_champion:
                         continue
                     champ_loser = semi2_winner if champ == semi1_winner else semi1_winner
 
                     total_combos += 1
-                    late_win_rate, avg_late_score = _evaluate_late_rounds_from_sims(
+                    sim_scores.append(_evaluate_late_rounds_from_sims(
                         f4, semi1_winner, semi2_winner, champ, score_cache, opp_max_scores, pool_size
-                    )
-                    heuristic_score = _quick_eval_late_rounds(
-                        f4, semi1_winner, semi1_loser,
-                        semi2_winner, semi2_loser,
-                        champ, champ_loser,
-                        reach_probs, pick_pcts, pool_size, accuracy_weight, rp,
-                        upset_mode, upset_values
-                    )
-                    score = (
-                        late_win_rate,
-                        accuracy_weight * avg_late_score + (1 - accuracy_weight) * heuristic_score,
-                        heuristic_score,
-                    )
-                    combo = (champ, list(f4), [semi1_winner, semi2_winner])
-                    all_scored.append((score, combo))
+                    ))
+                    p_matchup_win, champ_pick, champ_pts = champ_terms[champ, champ_loser]
+                    partial_emv.append(f4_total + semi1_emv + semi2_emv)
+                    champ_probs.append(p_semi1_win * p_semi2_win * p_matchup_win)
+                    champ_picks.append(champ_pick)
+                    champ_points.append(champ_pts)
+                    combos.append((champ, list(f4), [semi1_winner, semi2_winner]))
+
+    # The champion term depends on the whole combo; value them all in one pass.
+    heuristic_scores = np.asarray(partial_emv) + _compute_pick_values(
+        np.asarray(champ_probs), np.asarray(champ_picks), np.asarray(champ_points),
+        pool_size, accuracy_weight
+    )
+    for (late_win_rate, avg_late_score), heuristic_score, combo in zip(
+        sim_scores, heuristic_scores.tolist(), combos
+    ):
+        score = (
+            late_win_rate,
+            accuracy_weight * avg_late_score + (1 - accuracy_weight) * heuristic_score,
+            heuristic_score,
+        )
+        all_scored.append((score, combo))
 
     _print(f"  Evaluated {total_combos} late-round combinations")
 
@@ -188,12 +260,12 @@ def _optimize_late_rounds(bracket, reach_probs, pick_pcts, pool_size,
     refine_sims = min(5000, n_sims)
     if refine_n > 1 and refine_sims > pre_sims:
         _print(f"  Refining top {refine_n} candidates with {refine_sims} simulations (pass 2)...")
-        sim_results_2 = [simulate_once_flat(bracket, rng) for _ in range(refine_sims)]
+        sim_results_2 = simulate_many_flat(bracket, rng, refine_sims, win_probs)
         score_cache_2 = _precompute_late_round_scores(
             sim_results_2, slot_candidates, rp, upset_mode, upset_values
         )
         opp_max_scores_2 = _precompute_opponent_late_round_scores(
-            bracket, pick_pcts, pool_size, sim_results_2, rng, rp, upset_mode, upset_values
+            bracket, pick_probs, pool_size, sim_results_2, rng, rp, upset_mode, upset_values
         )
         refined: list[tuple[tuple, tuple]] = []
         for orig_score, cfg in all_scored[:refine_n]:
@@ -230,61 +302,79 @@ def _optimize_late_rounds(bracket, reach_probs, pick_pcts, pool_size,
     return best_config
 
 
-def _quick_eval_late_rounds(f4_teams, semi1_winner, semi1_loser,
-                            semi2_winner, semi2_loser,
-                            champion, champ_loser,
-                            reach_probs, pick_pcts, pool_size, accuracy_weight,
-                            round_points=None,
-                            upset_mode=None, upset_values=None):
-    """Quick scoring of a late-round configuration using leverage-aware value.
+def _f4_combos(candidates_per_region: list[list[Team]], force_champion: str | None = None):
+    """Yield every Final Four (one candidate per region), in ``product`` order.
 
-    No simulation needed — uses pre-computed reach probabilities.
-    Now accounts for upset bonuses in semifinal and championship matchups.
+    With ``force_champion``, only combos containing that team are produced:
+    its region is narrowed to just that team before taking the product.
     """
-    rp = round_points or config.ROUND_POINTS
-    total_emv = 0.0
-
-    # Score Final Four picks by the unconditional chance of reaching the F4.
-    # We do not know the exact Elite Eight opponent yet at this stage.
-    for team in f4_teams:
-        p_reach = reach_probs.get(team.name, {}).get(5, 0.0)
-        pick_frac = get_round_pick_pct(pick_pcts, team.name, team.seed, 5)
-        emv = _compute_pick_value(p_reach, pick_frac, rp[4], pool_size, accuracy_weight)
-        total_emv += emv
-
-    # Score semifinal winners (round 5 = Final Four)
-    # Use Log5 for the specific matchup instead of marginal reach probabilities,
-    # then weight by the probability both teams actually reached the Final Four.
-    for winner, loser in [(semi1_winner, semi1_loser), (semi2_winner, semi2_loser)]:
-        p_winner_f4 = reach_probs.get(winner.name, {}).get(5, 0.0)
-        p_loser_f4 = reach_probs.get(loser.name, {}).get(5, 0.0)
-        p_matchup_win = log5(winner.rating, loser.rating)
-        # P(winner wins this semifinal) ≈ P(both reach F4) × P(winner beats loser)
-        p_reach = p_winner_f4 * p_loser_f4 * p_matchup_win
-        pick_frac = get_matchup_pick_prob(
-            pick_pcts, winner.name, winner.seed, loser.name, loser.seed, 6
-        )
-        pts = compute_game_points(winner, loser, 5, rp, upset_mode, upset_values)
-        emv = _compute_pick_value(p_reach, pick_frac, pts, pool_size, accuracy_weight)
-        total_emv += emv
-
-    # Score champion (round 6 = Championship)
-    # Use Log5 for the specific championship matchup.
-    p_semi1_win = reach_probs.get(semi1_winner.name, {}).get(5, 0.0) * \
-                  reach_probs.get(semi1_loser.name, {}).get(5, 0.0) * \
-                  log5(semi1_winner.rating, semi1_loser.rating)
-    p_semi2_win = reach_probs.get(semi2_winner.name, {}).get(5, 0.0) * \
-                  reach_probs.get(semi2_loser.name, {}).get(5, 0.0) * \
-                  log5(semi2_winner.rating, semi2_loser.rating)
-    p_champ = p_semi1_win * p_semi2_win * log5(champion.rating, champ_loser.rating)
-    champ_pick = get_matchup_pick_prob(
-        pick_pcts, champion.name, champion.seed, champ_loser.name, champ_loser.seed, 7
-    )
-    champ_pts = compute_game_points(champion, champ_loser, 6, rp, upset_mode, upset_values)
-    emv = _compute_pick_value(p_champ, champ_pick, champ_pts, pool_size, accuracy_weight)
-    total_emv += emv
+    if not force_champion:
+        yield from product(*candidates_per_region)
+        return
+
+    for region_idx, candidates in enumerate(candidates_per_region):
+        forced = [team for team in candidates if team.name == force_champion]
+        if forced:
+            yield from product(
+                *candidates_per_region[:region_idx], forced, *candidates_per_region[region_idx + 1:]
+            )
+
+
+def _f4_pick_emv(team_id, reach_rows, pick_rows, pool_size, accuracy_weight, round_points):
+    """Leverage-aware value of picking a team to reach the Final Four.
+
+    Uses the unconditional chance of reaching the F4, since the exact Elite
+    Eight opponent is not known at this stage. ``reach_rows`` and
+    ``pick_rows`` are ``build_reach_table`` / ``build_pick_pct_table`` rows.
+    """
+    p_reach = reach_rows[team_id][5]
+    pick_frac = pick_rows[team_id][5]
+    return _compute_pick_value(p_reach, pick_frac, round_points[4], pool_size, accuracy_weight)
+
+
+def _semifinal_pick_emv(winner, loser, winner_id, loser_id, reach_rows, pick_rows,
+                        pool_size, accuracy_weight, round_points,
+                        upset_mode=None, upset_values=None):
+    """Value of picking ``winner`` over ``loser`` in a semifinal (round 5).
+
+    Uses Log5 for the specific matchup instead of marginal reach probabilities,
+    weighted by the probability both teams actually reached the Final Four.
+
+    Returns:
+        (emv, p_win) where p_win ≈ P(both reach F4) × P(winner beats loser)
+    """
+    p_winner_f4 = reach_rows[winner_id][5]
+    p_loser_f4 = reach_rows[loser_id][5]
+    p_matchup_win = log5(winner.rating, loser.rating)
+    p_win = p_winner_f4 * p_loser_f4 * p_matchup_win
+    pick_frac = _matchup_pick_prob(pick_rows, winner_id, loser_id, 6)
+    pts = compute_game_points(winner, loser, 5, round_points, upset_mode, upset_values)
+    return _compute_pick_value(p_win, pick_frac, pts, pool_size, accuracy_weight), p_win
+
+
+def _championship_pick_terms(champion, champ_loser, champion_id, champ_loser_id, pick_rows,
+                             round_points, upset_mode=None, upset_values=None):
+    """Matchup-only terms of a championship pick (round 6).
+
+    The pick's value also depends on both semifinal win chances, so callers
+    combine these with them via ``_compute_pick_value``.
+
+    Returns:
+        (Log5 win probability, public pick fraction, points incl. upset bonus)
+    """
+    p_matchup_win = log5(champion.rating, champ_loser.rating)
+    champ_pick = _matchup_pick_prob(pick_rows, champion_id, champ_loser_id, 7)
+    champ_pts = compute_game_points(champion, champ_loser, 6, round_points, upset_mode, upset_values)
+    return p_matchup_win, champ_pick, champ_pts
 
-    return total_emv
+
+def _matchup_pick_prob(pick_rows, a_id, b_id, round_reaching):
+    """Table-driven ``get_matchup_pick_prob``: public pick rate for team A over B."""
+    pct_a = pick_rows[a_id][round_reaching]
+    total = pct_a + pick_rows[b_id][round_reaching]
+    if total <= 0:
+        return 0.5
+    return pct_a / total
 
 
 def _compute_pick_value(model_prob: float, public_prob: float, points: float,
@@ -304,25 +394,48 @@ def _compute_pick_value(model_prob: float, public_prob: float, points: float,
     public_prob = min(0.999, max(0.001, public_prob))
     leverage_ratio = model_prob / public_prob
     leverage_ratio = min(4.0, max(0.25, leverage_ratio))
+    leverage_multiplier = leverage_ratio ** _leverage_exponent(pool_size, accuracy_weight)
+
+    return model_prob * points * leverage_multiplier
+
+
+def _compute_pick_values(model_probs: np.ndarray, public_probs: np.ndarray, points: np.ndarray,
+                         pool_size: int, accuracy_weight: float) -> np.ndarray:
+    """Vectorized ``_compute_pick_value`` over arrays of picks."""
+    if accuracy_weight >= 1.0:
+        return np.where(model_probs > 0, model_probs * points, 0.0)
+
+    public_probs = np.clip(public_probs, 0.001, 0.999)
+    leverage_ratio = np.clip(model_probs / public_probs, 0.25, 4.0)
+    leverage_multiplier = leverage_ratio ** _leverage_exponent(pool_size, accuracy_weight)
+
+    return np.where(model_probs > 0, model_probs * points * leverage_multiplier, 0.0)
 
+
+@lru_cache(maxsize=32)
+def _leverage_exponent(pool_size: int, accuracy_weight: float) -> float:
+    """Exponent applied to a pick's leverage ratio; fixed for a given optimize() call."""
     contrarian_weight = max(0.0, 1.0 - accuracy_weight)
     pool_term = max(1.0, math.log(max(pool_size, 2)))
     # Make the slider more responsive in small pools. The previous mapping
     # only nudged the leverage exponent from ~0.5 to ~1.2 when moving from
     # 0.75 to 0.40 in a 7-person pool, which barely changed first-round picks.
     slider_term = contrarian_weight / max(0.5, accuracy_weight)
-    leverage_exponent = min(3.5, pool_term * slider_term)
-    leverage_multiplier = leverage_ratio ** leverage_exponent
-
-    return model_prob * points * leverage_multiplier
+    return min(3.5, pool_term * slider_term)
 
 
 def _fill_bracket_forward(result, champion, f4_teams, semi_winners,
-                          reach_probs, pick_pcts, pool_size, accuracy_weight,
+                          reach_table, pick_table, pool_size, accuracy_weight,
                           round_points=None,
                           upset_mode=None, upset_values=None):
-    """Fill each region subtree optimally, conditioned on the chosen F4 teams."""
+    """Fill each region subtree optimally, conditioned on the chosen F4 teams.
+
+    ``reach_table`` and ``pick_table`` come from ``build_reach_table`` and
+    ``build_pick_pct_table`` over ``result.teams``.
+    """
     rp = round_points or config.ROUND_POINTS
+    reach_rows = reach_table.tolist()
+    pick_rows = pick_table.tolist()
 
     # Set the late-round results
     result.set_winner(1, champion)
@@ -334,16 +447,25 @@ def _fill_bracket_forward(result, champion, f4_teams, semi_winners,
     # Optimize each regional subtree jointly so coordinated upset paths can win.
     for region_idx, forced_team in enumerate(f4_teams):
         root_slot = 4 + region_idx
+        # Bit s set = the forced team must win game slot s; only its plans
+        # are worth building there.
+        start_slot = result.get_starting_slot(forced_team)
+        forced_mask = 0
+        if start_slot is not None:
+            for slot in result.get_path_to_championship(start_slot):
+                forced_mask |= 1 << slot
         plans = _optimize_region_subtree(
             result,
             root_slot,
-            reach_probs,
-            pick_pcts,
+            reach_rows,
+            pick_rows,
             pool_size,
             accuracy_weight,
             rp,
             upset_mode,
             upset_values,
+            forced_team,
+            forced_mask,
         )
         chosen = plans.get(forced_team)
         if chosen is None:
@@ -357,31 +479,40 @@ def _fill_bracket_forward(result, champion, f4_teams, semi_winners,
 
 def _optimize_region_subtree(bracket: Bracket,
                              game_slot: int,
-                             reach_probs: dict[str, dict[int, float]],
-                             pick_pcts: dict[str, dict[int, float]],
+                             reach_rows: list[list[float]],
+                             pick_rows: list[list[float]],
                              pool_size: int,
                              accuracy_weight: float,
                              round_points: dict[int, int],
                              upset_mode: str | None,
-                             upset_values: dict[int, float] | None) -> dict[Team, tuple[float, dict[int, Team]]]:
-    """Return the best subtree plan for each possible winner at a game slot."""
+                             upset_values: dict[int, float] | None,
+                             forced_team: Team | None = None,
+                             forced_mask: int = 0) -> dict[Team, tuple[float, dict[int, Team]]]:
+    """Return the best subtree plan for each possible winner at a game slot.
+
+    Slots whose bit is set in ``forced_mask`` only build plans in which
+    ``forced_team`` wins, since no other winner can lead to the forced pick.
+    ``reach_rows`` and ``pick_rows`` are reach / pick-rate table rows by team id.
+    """
     if game_slot >= 64:
         team = bracket.slots[game_slot]
         return {team: (0.0, {})} if team is not None else {}
 
     left_slot, right_slot = bracket.get_matchup(game_slot)
     left_plans = _optimize_region_subtree(
-        bracket, left_slot, reach_probs, pick_pcts, pool_size, accuracy_weight,
-        round_points, upset_mode, upset_values
+        bracket, left_slot, reach_rows, pick_rows, pool_size, accuracy_weight,
+        round_points, upset_mode, upset_values, forced_team, forced_mask
     )
     right_plans = _optimize_region_subtree(
-        bracket, right_slot, reach_probs, pick_pcts, pool_size, accuracy_weight,
-        round_points, upset_mode, upset_values
+        bracket, right_slot, reach_rows, pick_rows, pool_size, accuracy_weight,
+        round_points, upset_mode, upset_values, forced_team, forced_mask
     )
 
     round_num = bracket.get_round(game_slot)
+    slot_forced = (forced_mask >> game_slot) & 1
     plans: dict[Team, tuple[float, dict[int, Team]]] = {}
 
+    team_id = bracket.team_id
     for team_a, (score_a, picks_a) in left_plans.items():
         for team_b, (score_b, picks_b) in right_plans.items():
             if team_a is None or team_b is None:
@@ -389,22 +520,20 @@ def _optimize_region_subtree(bracket: Bracket,
 
             shared_picks = dict(picks_a)
             shared_picks.update(picks_b)
+            id_a, id_b = team_id(team_a), team_id(team_b)
 
-            for winner, loser in ((team_a, team_b), (team_b, team_a)):
+            for winner, loser, winner_id, loser_id in (
+                (team_a, team_b, id_a, id_b), (team_b, team_a, id_b, id_a)
+            ):
+                if slot_forced and winner != forced_team:
+                    continue
                 # Use unconditional reach probability P(team wins this game)
                 # = P(team reaches next round), NOT the conditional
                 # P(win | reached) which inflates deep upset path values.
-                model_prob = reach_probs.get(winner.name, {}).get(round_num + 1, 0.0)
+                model_prob = reach_rows[winner_id][round_num + 1]
                 pick_value = _compute_pick_value(
                     model_prob,
-                    get_matchup_pick_prob(
-                        pick_pcts,
-                        winner.name,
-                        winner.seed,
-                        loser.name,
-                        loser.seed,
-                        round_num + 1,
-                    ),
+                    _matchup_pick_prob(pick_rows, winner_id, loser_id, round_num + 1),
                     compute_game_points(winner, loser, round_num, round_points, upset_mode, upset_values),
                     pool_size,
                     accuracy_weight,
@@ -423,27 +552,61 @@ def _optimize_region_subtree(bracket: Bracket,
 
 def _validate(picks, bracket, pick_pcts, pool_size, n_sims, rng,
               round_points=None, quiet=False,
-              upset_mode=None, upset_values=None):
-    """Validate the bracket via Monte Carlo simulation against opponent pool."""
+              upset_mode=None, upset_values=None,
+              win_probs=None, pick_probs=None):
+    """Validate the bracket via Monte Carlo simulation against opponent pool.
+
+    Tournaments and opponents are drawn here for both backends; with Numba
+    the compiled kernel scores them, so results don't depend on whether it
+    is installed.
+    """
     rp = round_points or config.ROUND_POINTS
+    if win_probs is None:
+        win_probs = build_win_prob_table(bracket)
+    if pick_probs is None:
+        pick_probs = build_pick_prob_table(bracket, pick_pcts)
+
+    # Opponents don't depend on the tournament outcome, so draw one shared
+    # set up front and give each sim a random pool_size - 1 of them. Reusing
+    # brackets across sims correlates their opponent pools slightly; with a
+    # set this large next to a family-sized pool the effect is negligible.
+    n_opps = pool_size - 1
+    if n_opps > 0:
+        n_shared = max(n_opps, min(config.VALIDATION_OPPONENT_POOL, n_sims * n_opps))
+        opp_pool = generate_opponent_ids_batch(bracket, pick_probs, rng, n_shared)
+        opp_draws = rng.integers(n_shared, size=(n_sims, n_opps))
+    else:
+        opp_pool = np.empty((0, 128), dtype=SLOT_ID_DTYPE)
+        opp_draws = np.empty((n_sims, 0), dtype=np.int64)
+
+    # Every actual outcome up front, one row per sim, from one bulk draw.
+    actual_rows = np.ascontiguousarray(simulate_many_ids(bracket, rng, n_sims, win_probs).T)
+
+    if HAVE_NUMBA:
+        return _validate_compiled(
+            picks, bracket, actual_rows, opp_pool, opp_draws, rp, upset_mode, upset_values, quiet
+        )
+
     wins = 0
     total_score = 0
 
-    iterator = tqdm(range(n_sims), desc="Validating") if not quiet else range(n_sims)
-    for _ in iterator:
-        # Simulate actual tournament outcome
-        actual = simulate_once_flat(bracket, rng)
+    iterator = range(n_sims)
+    if not quiet:
+        # Refresh at most ~100 times so the bar costs nothing per iteration.
+        iterator = tqdm(iterator, desc="Validating", miniters=max(1, n_sims // 100), mininterval=0.5)
+    for sim_idx in iterator:
+        actual_ids = actual_rows[sim_idx]
 
         # Score our bracket
-        my_score = score_bracket(picks, actual, rp, upset_mode, upset_values)
+        my_score = score_bracket_ids(picks, actual_ids, rp, upset_mode, upset_values)
         total_score += my_score
 
-        # Simulate opponents
+        # Score this sim's opponents at once; only the best score matters.
         max_opp_score = 0
-        for _ in range(pool_size - 1):
-            opp = generate_opponent_bracket(bracket, pick_pcts, rng)
-            opp_score = score_bracket(opp, actual, rp, upset_mode, upset_values)
-            max_opp_score = max(max_opp_score, opp_score)
+        if n_opps > 0:
+            opp_ids = opp_pool[opp_draws[sim_idx]]
+            opp_scores = score_pick_ids_batch(opp_ids, actual_ids, bracket.teams, rp, upset_mode, upset_values)
+            max_opp_score = max(max_opp_score, float(opp_scores.max()))
 
         if my_score > max_opp_score:
             wins += 1
@@ -455,6 +618,48 @@ def _validate(picks, bracket, pick_pcts, pool_size, n_sims, rng,
     return wins / n_sims, total_score / n_sims
 
 
+def _validate_compiled(picks, bracket, actual_rows, opp_pool, opp_draws,
+                       round_points, upset_mode=None, upset_values=None, quiet=False):
+    """Score ``_validate``'s sims and opponent pool through the Numba kernel.
+
+    Sims go through the kernel ``config.VALIDATION_CHUNK`` at a time so the
+    progress bar moves as they are scored, like the pure-Python loop's.
+    """
+    round_table = np.zeros(7)
+    for round_num, points in round_points.items():
+        round_table[round_num] = points
+
+    mode = UPSET_NONE
+    upset_table = np.zeros(7)
+    if upset_mode and upset_values:
+        mode = {"multiplier": UPSET_MULTIPLIER, "fixed": UPSET_FIXED}.get(upset_mode, UPSET_NONE)
+        for round_num, value in upset_values.items():
+            upset_table[round_num] = value
+
+    n_sims = len(actual_rows)
+    slot_round = SLOT_ROUND.astype(np.int64)
+    wins = 0.0
+    total_score = 0.0
+    with tqdm(total=n_sims, desc="Validating", unit="sim", disable=quiet) as progress:
+        for start in range(0, n_sims, config.VALIDATION_CHUNK):
+            stop = min(start + config.VALIDATION_CHUNK, n_sims)
+            chunk_wins, chunk_score = validate_kernel(
+                picks.slot_ids,
+                actual_rows[start:stop],
+                opp_pool,
+                opp_draws[start:stop],
+                slot_round,
+                round_table,
+                bracket.seeds,
+                mode,
+                upset_table,
+            )
+            wins += chunk_wins
+            total_score += chunk_score
+            progress.update(stop - start)
+    return wins / n_sims, total_score / n_sims
+
+
 def _conditional_advance_prob(team: Team,
                               round_num: int,
                               reach_probs: dict[str, dict[int, float]]) -> float:
@@ -520,7 +725,7 @@ def _precompute_late_round_scores(sim_results: list[list[Team | None]],
 
 
 def _precompute_opponent_late_round_scores(bracket: Bracket,
-                                           pick_pcts: dict[str, dict[int, float]],
+                                           pick_probs: np.ndarray,
                                            pool_size: int,
                                            sim_results: list[list[Team | None]],
                                            rng: np.random.Generator,
@@ -532,11 +737,15 @@ def _precompute_opponent_late_round_scores(bracket: Bracket,
     if pool_size <= 1:
         return opp_max_scores
 
+    teams = bracket.teams
+    opp_ids = [-1] * 64 + bracket.starting_ids.tolist()
     for sim_idx, actual in enumerate(sim_results):
         max_score = 0.0
         for _ in range(pool_size - 1):
-            opp = generate_opponent_bracket(bracket, pick_pcts, rng)
-            opp_score = _score_late_rounds(opp.slots, actual, round_points, upset_mode, upset_values)
+            generate_opponent_ids(bracket, pick_probs, rng, opp_ids)
+            # Late-round slots all sit below 8, so only those need Team objects.
+            opp_slots = [teams[i] if i >= 0 else None for i in opp_ids[:8]]
+            opp_score = _score_late_rounds(opp_slots, actual, round_points, upset_mode, upset_values)
             max_score = max(max_score, opp_score)
         opp_max_scores[sim_idx] = max_score
 
@@ -8,34 +8,48 @@ import json
 import os
 import re
 
+import numpy as np
+
 import config
 
 ALIASES_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "team_aliases.json")
 
 
+# Default public pick rates by seed, indexed DEFAULT_PICK[seed, round_reaching]
+# for rounds 2-7. Row 0 (unknown seed) copies the 8-seed row; rounds 0-1 hold
+# the 0.01 catch-all.
+_DEFAULT_PICK_BY_SEED = {
+    1: (0.97, 0.85, 0.65, 0.40, 0.25, 0.15),
+    2: (0.93, 0.72, 0.45, 0.25, 0.13, 0.07),
+    3: (0.85, 0.55, 0.28, 0.12, 0.05, 0.02),
+    4: (0.80, 0.45, 0.20, 0.08, 0.03, 0.01),
+    5: (0.65, 0.30, 0.12, 0.04, 0.01, 0.005),
+    6: (0.62, 0.28, 0.10, 0.03, 0.01, 0.004),
+    7: (0.58, 0.25, 0.08, 0.03, 0.01, 0.003),
+    8: (0.48, 0.18, 0.06, 0.02, 0.005, 0.002),
+    9: (0.42, 0.15, 0.05, 0.015, 0.004, 0.001),
+    10: (0.38, 0.13, 0.04, 0.01, 0.003, 0.001),
+    11: (0.35, 0.12, 0.04, 0.01, 0.003, 0.001),
+    12: (0.32, 0.10, 0.03, 0.008, 0.002, 0.0005),
+    13: (0.18, 0.04, 0.01, 0.002, 0.0005, 0.0001),
+    14: (0.12, 0.02, 0.005, 0.001, 0.0002, 0.00005),
+    15: (0.05, 0.01, 0.002, 0.0004, 0.0001, 0.00002),
+    16: (0.02, 0.003, 0.0005, 0.0001, 0.00002, 0.000005),
+}
+DEFAULT_PICK = np.array(
+    [
+        (0.01, 0.01) + _DEFAULT_PICK_BY_SEED.get(seed, _DEFAULT_PICK_BY_SEED[8])
+        for seed in range(17)
+    ],
+    dtype=np.float64,
+)
+_DEFAULT_PICK_ROWS = DEFAULT_PICK.tolist()
+
+
 def default_pick_pct(seed: int, round_reaching: int) -> float:
     """Default public pick percentage when no source data is available."""
-    defaults = {
-        1: {2: 0.97, 3: 0.85, 4: 0.65, 5: 0.40, 6: 0.25, 7: 0.15},
-        2: {2: 0.93, 3: 0.72, 4: 0.45, 5: 0.25, 6: 0.13, 7: 0.07},
-        3: {2: 0.85, 3: 0.55, 4: 0.28, 5: 0.12, 6: 0.05, 7: 0.02},
-        4: {2: 0.80, 3: 0.45, 4: 0.20, 5: 0.08, 6: 0.03, 7: 0.01},
-        5: {2: 0.65, 3: 0.30, 4: 0.12, 5: 0.04, 6: 0.01, 7: 0.005},
-        6: {2: 0.62, 3: 0.28, 4: 0.10, 5: 0.03, 6: 0.01, 7: 0.004},
-        7: {2: 0.58, 3: 0.25, 4: 0.08, 5: 0.03, 6: 0.01, 7: 0.003},
-        8: {2: 0.48, 3: 0.18, 4: 0.06, 5: 0.02, 6: 0.005, 7: 0.002},
-        9: {2: 0.42, 3: 0.15, 4: 0.05, 5: 0.015, 6: 0.004, 7: 0.001},
-        10: {2: 0.38, 3: 0.13, 4: 0.04, 5: 0.01, 6: 0.003, 7: 0.001},
-        11: {2: 0.35, 3: 0.12, 4: 0.04, 5: 0.01, 6: 0.003, 7: 0.001},
-        12: {2: 0.32, 3: 0.10, 4: 0.03, 5: 0.008, 6: 0.002, 7: 0.0005},
-        13: {2: 0.18, 3: 0.04, 4: 0.01, 5: 0.002, 6: 0.0005, 7: 0.0001},
-        14: {2: 0.12, 3: 0.02, 4: 0.005, 5: 0.001, 6: 0.0002, 7: 0.00005},
-        15: {2: 0.05, 3: 0.01, 4: 0.002, 5: 0.0004, 6: 0.0001, 7: 0.00002},
-        16: {2: 0.02, 3: 0.003, 4: 0.0005, 5: 0.0001, 6: 0.00002, 7: 0.000005},
-    }
-
-    seed_defaults = defaults.get(seed, defaults[8])
-    return seed_defaults.get(round_reaching, 0.01)
+    row = _DEFAULT_PICK_ROWS[seed] if 0 <= seed <= 16 else _DEFAULT_PICK_ROWS[0]
+    return row[round_reaching] if 0 <= round_reaching <= 7 else 0.01
 
 
 def normalize_pick_pcts(pick_pcts: dict[str, dict[int, float]] | None) -> dict[str, dict[int, float]]:
@@ -94,7 +108,7 @@ def normalize_pick_pcts(pick_pcts: dict[str, dict[int, float]] | None) -> dict[s
 def get_pick_pct(pick_pcts: dict[str, dict[int, float]],
                  team_name: str,
                  round_reaching: int,
-                 default: float) -> float:
+                 default: float | None) -> float | None:
     """Look up a team's public pick rate with compatibility for legacy data."""
     rounds = _lookup_pick_rounds(pick_pcts, team_name)
     if round_reaching in rounds:
@@ -113,12 +127,34 @@ def get_round_pick_pct(
     round_reaching: int,
 ) -> float:
     """Get a team's public pick rate for reaching a given round."""
-    return get_pick_pct(
-        pick_pcts,
-        team_name,
-        round_reaching,
-        default_pick_pct(seed, round_reaching),
-    )
+    pct = get_pick_pct(pick_pcts, team_name, round_reaching, None)
+    if pct is None:
+        return default_pick_pct(seed, round_reaching)
+    return pct
+
+
+def build_pick_pct_table(teams, pick_pcts: dict[str, dict[int, float]],
+                         seed_defaults: bool = True) -> np.ndarray:
+    """Tabulate ``get_round_pick_pct`` by team id.
+
+    Args:
+        teams: Teams in id order
+        pick_pcts: {team_name: {round: pick_fraction}}
+        seed_defaults: Fill gaps with ``default_pick_pct``; when False they
+            are left as NaN
+
+    Returns:
+        Array of shape (len(teams), 8) where ``[i, r]`` is the public pick
+        rate for ``teams[i]`` reaching round ``r``.
+    """
+    table = np.empty((len(teams), 8))
+    for i, team in enumerate(teams):
+        for round_reaching in range(8):
+            if seed_defaults:
+                table[i, round_reaching] = get_round_pick_pct(pick_pcts, team.name, team.seed, round_reaching)
+            else:
+                table[i, round_reaching] = get_pick_pct(pick_pcts, team.name, round_reaching, np.nan)
+    return table
 
 
 def get_matchup_pick_prob(
@@ -12,10 +12,10 @@ rounds inherit the earlier pick with a consistency bias.
 
 import numpy as np
 
-from models.bracket import Bracket
-from models.probability import log5
+from models.bracket import Bracket, ROUND_MATCHUPS
+from models.probability import log5, log5_matrix
 from models.team import Team
-from optimizer.pick_utils import get_pick_pct
+from optimizer.pick_utils import build_pick_pct_table, get_pick_pct
 
 
 def generate_opponent_bracket(bracket: Bracket, pick_pcts: dict[str, dict[int, float]],
@@ -36,14 +36,13 @@ def generate_opponent_bracket(bracket: Bracket, pick_pcts: dict[str, dict[int, f
     """
     opp = bracket.copy()
 
-    for round_num in range(1, 7):
-        for game_slot in opp.get_all_game_slots_for_round(round_num):
-            left_slot, right_slot = opp.get_matchup(game_slot)
+    for round_num, matchups in ROUND_MATCHUPS.items():
+        for game_slot, left_slot, right_slot in matchups:
             team_a = opp.slots[left_slot]
             team_b = opp.slots[right_slot]
 
             if team_a is None or team_b is None:
-                opp.slots[game_slot] = team_a or team_b
+                opp.set_winner(game_slot, team_a or team_b)
                 continue
 
             # Determine pick probability for team_a in this specific matchup.
@@ -52,11 +51,113 @@ def generate_opponent_bracket(bracket: Bracket, pick_pcts: dict[str, dict[int, f
             # rounds, giving natural bracket correlation.
             p_pick_a = _get_pick_prob(team_a, team_b, round_num, pick_pcts)
 
-            opp.slots[game_slot] = team_a if rng.random() < p_pick_a else team_b
+            opp.set_winner(game_slot, team_a if rng.random() < p_pick_a else team_b)
 
     return opp
 
 
+def generate_opponent_ids(bracket: Bracket, pick_probs: np.ndarray,
+                          rng: np.random.Generator, out: list[int]) -> list[int]:
+    """Fill ``out`` with one simulated opponent bracket as team ids.
+
+    Makes the same picks, from the same random draws, as
+    ``generate_opponent_bracket`` without copying the bracket. ``out`` is a
+    caller-owned 128-slot buffer whose starting slots (64-127) already hold
+    ``bracket.starting_ids``; every game slot is overwritten, so the buffer
+    can be reused for each opponent in a pool.
+
+    Args:
+        bracket: The base 64-team bracket (teams in starting slots)
+        pick_probs: Table from ``build_pick_prob_table``
+        rng: Random number generator
+        out: 128-element list of team ids, updated in place
+
+    Returns:
+        ``out``
+    """
+    for round_num, matchups in ROUND_MATCHUPS.items():
+        round_probs = pick_probs[round_num]
+        for game_slot, left_slot, right_slot in matchups:
+            a = out[left_slot]
+            b = out[right_slot]
+            if a < 0 or b < 0:
+                out[game_slot] = a if a >= 0 else b
+            else:
+                out[game_slot] = a if rng.random() < round_probs[a, b] else b
+
+    return out
+
+
+def generate_opponent_ids_batch(bracket: Bracket, pick_probs: np.ndarray,
+                                rng: np.random.Generator, n_opps: int) -> np.ndarray:
+    """Generate ``n_opps`` opponent brackets as team ids in one vectorized pass.
+
+    Picks follow the same model as ``generate_opponent_bracket``; all random
+    draws are taken up front and each round is resolved for every opponent
+    with a single ``np.where``.
+
+    Args:
+        bracket: The base 64-team bracket (teams in starting slots)
+        pick_probs: Table from ``build_pick_prob_table``
+        rng: Random number generator
+        n_opps: Number of opponent brackets
+
+    Returns:
+        Array of shape (n_opps, 128) of team ids; -1 marks an empty slot.
+    """
+    ids = np.tile(bracket.slot_ids, (n_opps, 1))
+    draws = rng.random((n_opps, 63))
+
+    for round_num in range(1, 7):
+        lo, hi = 1 << (6 - round_num), 1 << (7 - round_num)  # game slots of this round
+        left = ids[:, 2 * lo:2 * hi:2]
+        right = ids[:, 2 * lo + 1:2 * hi:2]
+        p_pick_a = pick_probs[round_num, left, right]
+        # A missing side forfeits to whichever team is present.
+        take_left = (right < 0) | ((left >= 0) & (draws[:, lo - 1:hi - 1] < p_pick_a))
+        ids[:, lo:hi] = np.where(take_left, left, right)
+
+    return ids
+
+
+def build_pick_prob_table(bracket: Bracket, pick_pcts: dict[str, dict[int, float]],
+                          log5_table: np.ndarray | None = None) -> np.ndarray:
+    """Tabulate ``_get_pick_prob`` for every team pairing, by round.
+
+    Each of ``_get_pick_prob``'s three cases (normalized pick data, seed
+    chalk, Log5 on ratings) is computed for all pairings at once and the
+    applicable one chosen with ``np.where``.
+
+    Args:
+        bracket: The 64-team bracket
+        pick_pcts: {team_name: {round: pick_fraction}}
+        log5_table: Optional precomputed ``log5_matrix`` of team ratings
+
+    Returns:
+        Array of shape (7, n_teams, n_teams) where ``[r, a, b]`` is the chance
+        a typical opponent picks team id ``a`` over ``b`` in round ``r``.
+    """
+    teams = bracket.teams
+    pcts = build_pick_pct_table(teams, pick_pcts, seed_defaults=False)
+    seeds = bracket.seeds
+    seed_gap = seeds[None, :] - seeds[:, None]  # positive = A is better seed
+    p_chalk = np.clip(0.5 + 0.03 * seed_gap, 0.15, 0.85)
+    if log5_table is None:
+        log5_table = log5_matrix(bracket.ratings)
+    p_fallback = np.where(seed_gap != 0, p_chalk, log5_table)
+
+    table = np.empty((7, len(teams), len(teams)))
+    table[0] = 0.5
+    for round_num in range(1, 7):
+        pct_a = pcts[:, round_num + 1][:, None]
+        pct_b = pcts[:, round_num + 1][None, :]
+        total = pct_a + pct_b
+        valid = (pct_a >= 0) & (pct_b >= 0) & (total > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            table[round_num] = np.where(valid, pct_a / total, p_fallback)
+    return table
+
+
 def _get_pick_prob(team_a: Team, team_b: Team, round_num: int,
                    pick_pcts: dict[str, dict[int, float]]) -> float:
     """Get the probability that a typical bracket picker chooses team_a over team_b.
@@ -5,6 +5,8 @@ from __future__ import annotations
 import json
 import os
 
+import numpy as np
+
 import config
 from optimizer.simulator import simulate_tournament
 
@@ -15,13 +17,18 @@ def resolve_reach_probs(bracket,
                         ratings: dict[str, dict] | None,
                         n_sims: int = config.DEFAULT_SIMULATIONS,
                         seed: int | None = 42,
-                        show_progress: bool = True) -> dict[str, dict[int, float]]:
+                        show_progress: bool = True,
+                        n_workers: int | None = None,
+                        backend: str | None = None) -> dict[str, dict[int, float]]:
     """Use direct forecast reach probabilities when present, else simulate."""
     direct = extract_direct_reach_probs_for_bracket(bracket, ratings)
     if direct and _has_complete_coverage(bracket, direct):
         return direct
 
-    simulated = simulate_tournament(bracket, n_sims=n_sims, seed=seed, show_progress=show_progress)
+    simulated = simulate_tournament(
+        bracket, n_sims=n_sims, seed=seed, show_progress=show_progress,
+        n_workers=n_workers, backend=backend,
+    )
     if not direct:
         return simulated
 
@@ -33,6 +40,36 @@ def resolve_reach_probs(bracket,
     return simulated
 
 
+def reach_probs_to_array(reach_probs: dict[str, dict[int, float]]) -> tuple[list[str], np.ndarray]:
+    """Pack ``{team: {round: p}}`` into team names and an ``(n_teams, 7)`` array.
+
+    Column ``r - 1`` holds the probability of reaching round ``r``; missing
+    rounds are 0.
+    """
+    team_names = list(reach_probs)
+    probs = np.zeros((len(team_names), 7))
+    for i, name in enumerate(team_names):
+        for round_num, value in reach_probs[name].items():
+            if 1 <= round_num <= 7:
+                probs[i, round_num - 1] = value
+    return team_names, probs
+
+
+def build_reach_table(teams, reach_probs: dict[str, dict[int, float]]) -> np.ndarray:
+    """Tabulate reach probabilities by team id.
+
+    Returns:
+        Array of shape (len(teams), 8) where ``[i, r]`` is the chance
+        ``teams[i]`` reaches round ``r``; missing rounds are 0.
+    """
+    table = np.zeros((len(teams), 8))
+    for i, team in enumerate(teams):
+        for round_num, value in reach_probs.get(team.name, {}).items():
+            if 0 <= round_num <= 7:
+                table[i, round_num] = value
+    return table
+
+
 def extract_direct_reach_probs_for_bracket(bracket,
                                            ratings: dict[str, dict] | None) -> dict[str, dict[int, float]]:
     """Extract source-provided reach probabilities keyed to bracket team names."""
@@ -54,7 +91,9 @@ def extract_direct_reach_probs_for_bracket(bracket,
         rounds = _coerce_reach_probs(entry.get("reach_probs"))
         if not rounds:
             continue
-        setattr(team, "reach_probs", rounds)
+        # Team is frozen; rebind the attribute rather than mutate a dict
+        # that may be shared with the caller's ratings.
+        object.__setattr__(team, "reach_probs", rounds)
         direct[team.name] = rounds
 
     return direct
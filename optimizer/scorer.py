@@ -4,10 +4,29 @@ Scores a filled bracket against actual tournament results using
 configurable scoring systems including upset bonuses.
 """
 
+from functools import lru_cache
+
+import numpy as np
+
 import config
-from models.bracket import Bracket
+from models.bracket import Bracket, SLOT_ROUND
 from models.team import Team
 
+_SLOT_ROUND_LIST = SLOT_ROUND.tolist()
+
+
+@lru_cache(maxsize=8)
+def _slot_points_for(round_points_items: tuple[tuple[int, int], ...]) -> np.ndarray:
+    """Base points per game slot (index 0 unused) for one scoring table."""
+    rp = dict(round_points_items)
+    return np.array([0] + [rp[r] for r in _SLOT_ROUND_LIST[1:]], dtype=np.float64)
+
+
+def slot_points(round_points: dict[int, int] | None = None) -> np.ndarray:
+    """Return the 64-element per-slot base points array for ``round_points``."""
+    rp = round_points or config.ROUND_POINTS
+    return _slot_points_for(tuple(sorted(rp.items())))
+
 
 def _compute_upset_bonus(winner: Team, loser: Team, round_num: int,
                          upset_mode: str | None,
@@ -84,35 +103,94 @@ def score_bracket(picks: Bracket, actual: list[Team | None],
         Total score (may be float if upset bonuses produce fractional values)
     """
     rp = round_points or config.ROUND_POINTS
-    total = 0.0
+    pick_slots = picks.slots
 
-    for game_slot in range(1, 64):
-        round_num = picks.get_round(game_slot)
+    if not upset_mode or not upset_values:
+        # No bonuses: a correct pick is worth exactly its slot's base points.
+        points = slot_points(rp).tolist()
+        total = 0.0
+        for game_slot in range(1, 64):
+            picked_team = pick_slots[game_slot]
+            if picked_team is not None and picked_team == actual[game_slot]:
+                total += points[game_slot]
+        return total
 
-        picked_team = picks.slots[game_slot]
+    total = 0.0
+    for game_slot in range(1, 64):
+        picked_team = pick_slots[game_slot]
         actual_team = actual[game_slot]
+        if picked_team is not None and actual_team is not None and picked_team == actual_team:
+            total += _correct_pick_points(
+                actual_team, game_slot, actual, rp, upset_mode, upset_values
+            )
+
+    return total
+
+
+def score_bracket_ids(picks: Bracket, actual_ids: np.ndarray,
+                      round_points: dict[int, int] | None = None,
+                      upset_mode: str | None = None,
+                      upset_values: dict[int, float] | None = None) -> float:
+    """Score a bracket against a tournament result given as team ids.
+
+    Same result as ``score_bracket`` but compares ``picks.slot_ids`` with
+    ``actual_ids`` (from ``Bracket.ids_of``) in one array op. Both must come
+    from brackets sharing an id space, i.e. copies of the same base bracket.
+    """
+    return score_pick_ids(picks.slot_ids, actual_ids, picks.teams, round_points, upset_mode, upset_values)
 
-        if picked_team is not None and actual_team is not None:
-            if picked_team == actual_team:
-                # Find the loser from the actual bracket
-                left_child = 2 * game_slot
-                right_child = 2 * game_slot + 1
-                if left_child < 128 and right_child < 128:
-                    left_team = actual[left_child]
-                    right_team = actual[right_child]
-                    if left_team and right_team:
-                        loser = right_team if actual_team == left_team else left_team
-                        total += compute_game_points(
-                            actual_team, loser, round_num, rp, upset_mode, upset_values
-                        )
-                    else:
-                        total += rp[round_num]
-                else:
-                    total += rp[round_num]
 
+def score_pick_ids(pick_ids: np.ndarray, actual_ids: np.ndarray, teams: list[Team],
+                   round_points: dict[int, int] | None = None,
+                   upset_mode: str | None = None,
+                   upset_values: dict[int, float] | None = None) -> float:
+    """Score a 128-slot array of picked team ids against the actual ids.
+
+    Lets callers score picks held in a reusable id buffer without wrapping
+    them in a ``Bracket``; ``teams`` maps ids back to ``Team`` objects.
+    """
+    rp = round_points or config.ROUND_POINTS
+    pick_ids = pick_ids[1:64]
+    matched = (pick_ids == actual_ids[1:64]) & (pick_ids >= 0)
+
+    if not upset_mode or not upset_values:
+        return float(slot_points(rp)[1:64] @ matched)
+
+    total = 0.0
+    for game_slot in (np.flatnonzero(matched) + 1).tolist():
+        winner_id = actual_ids[game_slot]
+        left_id = actual_ids[2 * game_slot]
+        right_id = actual_ids[2 * game_slot + 1]
+        round_num = _SLOT_ROUND_LIST[game_slot]
+        if left_id >= 0 and right_id >= 0:
+            loser_id = right_id if winner_id == left_id else left_id
+            total += compute_game_points(
+                teams[winner_id], teams[loser_id], round_num, rp, upset_mode, upset_values
+            )
+        else:
+            total += rp[round_num]
     return total
 
 
+def score_pick_ids_batch(pick_ids: np.ndarray, actual_ids: np.ndarray, teams: list[Team],
+                         round_points: dict[int, int] | None = None,
+                         upset_mode: str | None = None,
+                         upset_values: dict[int, float] | None = None) -> np.ndarray:
+    """Score each row of an (n, 128) id array against the actual ids.
+
+    Returns:
+        Array of n scores, each equal to ``score_pick_ids`` for that row.
+    """
+    if not upset_mode or not upset_values:
+        rows = pick_ids[:, 1:64]
+        matched = (rows == actual_ids[1:64]) & (rows >= 0)
+        return matched @ slot_points(round_points)[1:64]
+    return np.array([
+        score_pick_ids(row, actual_ids, teams, round_points, upset_mode, upset_values)
+        for row in pick_ids
+    ])
+
+
 def score_bracket_by_round(picks: Bracket, actual: list[Team | None],
                            round_points: dict[int, int] | None = None,
                            upset_mode: str | None = None,
@@ -124,28 +202,30 @@ def score_bracket_by_round(picks: Bracket, actual: list[Team | None],
     """
     rp = round_points or config.ROUND_POINTS
     by_round: dict[int, float] = {r: 0.0 for r in range(1, 7)}
+    pick_slots = picks.slots
 
     for game_slot in range(1, 64):
-        round_num = picks.get_round(game_slot)
-
-        picked_team = picks.slots[game_slot]
+        picked_team = pick_slots[game_slot]
         actual_team = actual[game_slot]
-
-        if picked_team is not None and actual_team is not None:
-            if picked_team == actual_team:
-                left_child = 2 * game_slot
-                right_child = 2 * game_slot + 1
-                if left_child < 128 and right_child < 128:
-                    left_team = actual[left_child]
-                    right_team = actual[right_child]
-                    if left_team and right_team:
-                        loser = right_team if actual_team == left_team else left_team
-                        by_round[round_num] += compute_game_points(
-                            actual_team, loser, round_num, rp, upset_mode, upset_values
-                        )
-                    else:
-                        by_round[round_num] += rp[round_num]
-                else:
-                    by_round[round_num] += rp[round_num]
+        if picked_team is not None and actual_team is not None and picked_team == actual_team:
+            by_round[_SLOT_ROUND_LIST[game_slot]] += _correct_pick_points(
+                actual_team, game_slot, actual, rp, upset_mode, upset_values
+            )
 
     return by_round
+
+
+def _correct_pick_points(actual_team: Team, game_slot: int, actual: list[Team | None],
+                         round_points: dict[int, int],
+                         upset_mode: str | None,
+                         upset_values: dict[int, float] | None) -> float:
+    """Points for a correct pick at ``game_slot``, including any upset bonus."""
+    round_num = _SLOT_ROUND_LIST[game_slot]
+    left_team = actual[2 * game_slot]
+    right_team = actual[2 * game_slot + 1]
+    if left_team and right_team:
+        loser = right_team if actual_team == left_team else left_team
+        return compute_game_points(
+            actual_team, loser, round_num, round_points, upset_mode, upset_values
+        )
+    return round_points[round_num]
@@ -6,17 +6,26 @@ it naturally handles the conditional probabilities (who you face in round 2
 depends on who won in round 1).
 """
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+
 import numpy as np
 from tqdm import tqdm
 
-from models.bracket import Bracket
-from models.probability import log5
+import config
+from models.bracket import (
+    Bracket, REGION_OF_SLOT, ROUND_GAME_SLOTS, ROUND_MATCHUPS, SLOT_ID_DTYPE, SLOT_ROUND,
+)
+from models.probability import log5, log5_matrix
 from models.team import Team
+from optimizer._cudakernel import HAVE_CUPY, count_reaches_cuda
+from optimizer._simkernel import HAVE_NUMBA, progress_counter, run_sims
 
 
 def simulate_tournament(bracket: Bracket, n_sims: int = 10_000,
                         seed: int | None = None,
-                        show_progress: bool = True) -> dict[str, dict[int, float]]:
+                        show_progress: bool = True,
+                        n_workers: int | None = None,
+                        backend: str | None = None) -> dict[str, dict[int, float]]:
     """Run Monte Carlo simulation of the tournament.
 
     Args:
@@ -24,6 +33,12 @@ def simulate_tournament(bracket: Bracket, n_sims: int = 10_000,
         n_sims: Number of simulations to run
         seed: Random seed for reproducibility
         show_progress: Show progress bar
+        n_workers: Processes to split the sims across (defaults to
+            ``config.SIM_WORKERS``). Each gets an independent stream spawned
+            from ``seed``, so results are reproducible for a given worker count.
+        backend: ``"numpy"`` or ``"cuda"`` (defaults to ``config.SIM_BACKEND``).
+            ``"cuda"`` runs the sims on the GPU with CuPy and ignores
+            ``n_workers``.
 
     Returns:
         {team_name: {round: probability_of_reaching_that_round}}
@@ -32,66 +47,260 @@ def simulate_tournament(bracket: Bracket, n_sims: int = 10_000,
         ...
         Round 7 = probability of winning championship
     """
-    rng = np.random.default_rng(seed)
-
-    # Initialize counters: how many times each team reaches each round
-    reach_counts: dict[str, dict[int, int]] = {}
-    for team in bracket.teams:
-        reach_counts[team.name] = {r: 0 for r in range(1, 8)}  # rounds 1-7
-        reach_counts[team.name][1] = n_sims  # everyone starts in round 1
-
-    iterator = range(n_sims)
-    if show_progress:
-        iterator = tqdm(iterator, desc="Simulating tournaments")
-
-    for _ in iterator:
-        result = simulate_once(bracket, rng)
-        for round_num, winners in result.items():
-            for team in winners:
-                reach_counts[team.name][round_num + 1] += 1
+    teams = bracket.teams
+    win_probs = build_win_prob_table(bracket)
+    n_workers = max(1, min(n_workers or config.SIM_WORKERS, n_sims))
+    backend = backend or config.SIM_BACKEND
+    if backend not in ("numpy", "cuda"):
+        raise ValueError(f"Unknown simulation backend: {backend}")
+
+    if backend == "cuda":
+        if not HAVE_CUPY:
+            raise RuntimeError("The cuda simulation backend requires CuPy (pip install cupy-cuda12x)")
+        reach_counts = count_reaches_cuda(bracket.slot_ids, win_probs, n_sims, seed, config.GPU_SIM_CHUNK)
+    elif n_workers == 1:
+        rng = np.random.default_rng(seed)
+        with tqdm(total=n_sims, desc="Simulating tournaments", unit="sim", disable=not show_progress) as progress:
+            reach_counts = _simulate_counts(bracket, rng, n_sims, win_probs, progress)
+    else:
+        chunks = [
+            (bracket, win_probs, len(chunk), child_seed)
+            for chunk, child_seed in zip(
+                np.array_split(np.arange(n_sims), n_workers),
+                np.random.SeedSequence(seed).spawn(n_workers),
+            )
+        ]
+        reach_counts = np.zeros((len(teams), 8), dtype=np.int64)
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = pool.map(_simulate_chunk, chunks)
+            if show_progress:
+                results = tqdm(results, total=n_workers, desc="Simulating tournaments", unit="chunk")
+            for counts in results:
+                reach_counts += counts
+
+    return _reach_probs_from_counts(teams, reach_counts, n_sims)
+
+
+def _reach_probs_from_counts(teams: list[Team], reach_counts: np.ndarray,
+                             n_sims: int) -> dict[str, dict[int, float]]:
+    """Convert ``_count_reaches`` output to the ``{team: {round: p}}`` shape callers expect."""
+    probs = (reach_counts[:, 1:] / n_sims).tolist()
+    return {team.name: dict(zip(range(1, 8), row)) for team, row in zip(teams, probs)}
+
+
+def _simulate_chunk(args) -> np.ndarray:
+    """Worker: simulate one share of the sims and return its reach counts."""
+    bracket, win_probs, n_sims, seed_seq = args
+    rng = np.random.default_rng(seed_seq)
+    return _simulate_counts(bracket, rng, n_sims, win_probs)
+
+
+def _simulate_counts(bracket: Bracket, rng: np.random.Generator, n_sims: int,
+                     win_probs: np.ndarray, progress: tqdm | None = None) -> np.ndarray:
+    """Simulate ``n_sims`` tournaments and return their ``_count_reaches`` tally.
+
+    Sims are played ``config.SIM_CHUNK`` at a time so the slot and draw
+    arrays stay cache-sized however large ``n_sims`` gets.
+    """
+    reach_counts = np.zeros((len(bracket.teams), 8), dtype=np.int64)
+    for start in range(0, n_sims, config.SIM_CHUNK):
+        chunk = min(config.SIM_CHUNK, n_sims - start)
+        slots = simulate_many_ids(bracket, rng, chunk, win_probs, progress)
+        reach_counts += _count_reaches(slots, len(bracket.teams))
+    return reach_counts
+
+
+def simulate_many_brackets(brackets: list[Bracket], n_sims: int = 10_000,
+                           seed: int | None = None) -> list[dict[str, dict[int, float]]]:
+    """Run ``simulate_tournament`` for several candidate brackets in one pass.
+
+    All brackets are played against the same random draws (common random
+    numbers), so differences between their results reflect the brackets
+    rather than sampling noise. It also means a region whose 16 starting
+    teams and their win odds match one already simulated plays out
+    identically, so its games are copied instead of re-simulated; brackets
+    that differ in one region only simulate that region and the Final Four.
+    Brackets with the same ratings share one log5 table.
+
+    Sims are played ``config.SIM_CHUNK`` at a time, drawing each chunk's
+    uniforms as ``_simulate_counts`` does, so a bracket's result matches
+    single-worker ``simulate_tournament`` on the NumPy backend for the same
+    seed.
 
-    # Convert counts to probabilities
-    reach_probs: dict[str, dict[int, float]] = {}
-    for name, counts in reach_counts.items():
-        reach_probs[name] = {r: c / n_sims for r, c in counts.items()}
+    Args:
+        brackets: Brackets with teams placed in starting slots
+        n_sims: Number of simulations per bracket
+        seed: Random seed for reproducibility
 
-    return reach_probs
+    Returns:
+        One ``{team_name: {round: probability}}`` dict per bracket, as
+        returned by ``simulate_tournament``.
+    """
+    rng = np.random.default_rng(seed)
 
+    # Team equality ignores ratings and forecast odds, so both caches are
+    # keyed on the numbers the games are actually played with.
+    log5_tables: dict[bytes, np.ndarray] = {}
+    win_prob_tables = []
+    region_keys = []
+    for bracket in brackets:
+        ratings_key = bracket.ratings.tobytes()
+        if ratings_key not in log5_tables:
+            log5_tables[ratings_key] = log5_matrix(bracket.ratings)
+        win_probs = build_win_prob_table(bracket, log5_tables[ratings_key]).astype(np.float32)
+        win_prob_tables.append(win_probs)
+        region_keys.append([_region_key(bracket, win_probs, region_idx) for region_idx in range(4)])
+
+    reach_counts = [np.zeros((len(bracket.teams), 8), dtype=np.int64) for bracket in brackets]
+    for start in range(0, n_sims, config.SIM_CHUNK):
+        chunk = min(config.SIM_CHUNK, n_sims - start)
+        draws = np.empty((63, chunk), dtype=np.float32)
+        rng.random(out=draws, dtype=np.float32)
+
+        # region key -> (bracket it was simulated in, its game rows), for this chunk's draws
+        region_cache: dict[tuple[int, tuple[Team | None, ...], bytes], tuple[Bracket, np.ndarray]] = {}
+        for bracket, win_probs, keys, counts in zip(brackets, win_prob_tables, region_keys, reach_counts):
+            slots = np.empty((128, chunk), dtype=SLOT_ID_DTYPE)
+            slots[:] = bracket.slot_ids[:, None]
+
+            for region_idx, (game_rows, key) in enumerate(zip(_REGION_GAME_ROWS, keys)):
+                cached = region_cache.get(key)
+                if cached is None:
+                    for round_num in range(1, 5):
+                        width = 8 >> (round_num - 1)
+                        lo = (1 << (6 - round_num)) + region_idx * width
+                        _play_games_block(slots, draws, win_probs[round_num], lo, lo + width)
+                    region_cache[key] = (bracket, slots[game_rows])
+                else:
+                    source, rows = cached
+                    slots[game_rows] = _translate_ids(rows, source, bracket)
+
+            for round_num in (5, 6):
+                game_slots = ROUND_GAME_SLOTS[round_num]
+                _play_games_block(slots, draws, win_probs[round_num], game_slots[0], game_slots[-1] + 1)
+
+            counts += _count_reaches(slots, len(bracket.teams))
+
+    return [
+        _reach_probs_from_counts(bracket.teams, counts, n_sims)
+        for bracket, counts in zip(brackets, reach_counts)
+    ]
+
+
+def _region_key(bracket: Bracket, win_probs: np.ndarray,
+                region_idx: int) -> tuple[int, tuple[Team | None, ...], bytes]:
+    """Key a region by its starting teams and their round 1-4 odds."""
+    leaves = slice(64 + 16 * region_idx, 80 + 16 * region_idx)
+    region_ids = bracket.slot_ids[leaves][bracket.slot_ids[leaves] >= 0]
+    region_odds = win_probs[1:5][:, region_ids[:, None], region_ids[None, :]]
+    return region_idx, tuple(bracket.slots[leaves]), region_odds.tobytes()
+
+
+# Game slots of each region's rounds 1-4, for copying a region's results.
+_REGION_GAME_ROWS = tuple(
+    np.array([slot for slot in range(4, 64) if REGION_OF_SLOT[slot] == region_idx]) for region_idx in range(4)
+)
+
+
+def _translate_ids(ids: np.ndarray, source: Bracket, target: Bracket) -> np.ndarray:
+    """Re-express team ids from ``source``'s id space in ``target``'s."""
+    if source.teams == target.teams:
+        return ids
+    mapping = np.array([target.team_id(team) for team in source.teams] + [-1], dtype=SLOT_ID_DTYPE)
+    return mapping[ids]  # -1 (empty) picks the trailing -1
+
+
+def _play_games_block(slots: np.ndarray, draws: np.ndarray, round_probs: np.ndarray, lo: int, hi: int):
+    """Play game slots ``lo:hi`` (all in one round) for every sim, in place."""
+    left = slots[2 * lo:2 * hi:2]
+    right = slots[2 * lo + 1:2 * hi:2]
+    p_left = round_probs[left, right]
+    # A missing side forfeits to whichever team is present.
+    take_left = (right < 0) | ((left >= 0) & (draws[lo - 1:hi - 1] < p_left))
+    slots[lo:hi] = np.where(take_left, left, right)
+
+
+def _count_reaches(slots: np.ndarray, n_teams: int) -> np.ndarray:
+    """Tally a ``simulate_many_ids`` result into an (n_teams, 8) reach-count array.
+
+    ``[i, r]`` = sims in which team id i reached round r (1-7); winning a
+    round-r game means reaching round r + 1.
+    """
+    reach_counts = np.zeros((n_teams, 8), dtype=np.int64)
+    reach_counts[:, 1] = slots.shape[1]  # everyone starts in round 1
+    for round_num, game_slots in ROUND_GAME_SLOTS.items():
+        winners = slots[game_slots[0]:game_slots[-1] + 1].ravel()
+        reach_counts[:, round_num + 1] = np.bincount(winners[winners >= 0], minlength=n_teams)
+    return reach_counts
+
+
+def simulate_many_ids(bracket: Bracket, rng: np.random.Generator, n_sims: int,
+                      win_probs: np.ndarray, progress: tqdm | None = None) -> np.ndarray:
+    """Simulate ``n_sims`` tournaments at once on team ids.
+
+    All uniforms are drawn in one float32 ``rng.random`` call up front (row
+    ``slot - 1`` for game slot ``slot``; only ever compared against win
+    probabilities, so single precision is plenty) and each round is played for every
+    sim with one ``np.where``, so the Python-level work is per round, not
+    per game.
+    With Numba installed the sims run in a compiled multi-threaded kernel
+    instead, which reports finished sims to ``progress`` as it goes.
 
-def simulate_once(bracket: Bracket, rng: np.random.Generator) -> dict[int, list[Team]]:
-    """Simulate a single tournament.
+    Args:
+        bracket: The 64-team bracket with teams placed in starting slots
+        rng: Random number generator
+        n_sims: Number of tournaments
+        win_probs: Table from ``build_win_prob_table``
+        progress: Optional progress bar, advanced by ``n_sims`` as sims finish
 
     Returns:
-        {round_num: [list of teams that won in that round]}
-        Round 1 winners advance to round 2, etc.
+        Array of shape (128, n_sims): column ``k`` is sim ``k``'s slot array
+        of team ids (see ``Bracket.slot_ids``); -1 marks an empty slot.
     """
-    # Work through the bracket from round 1 to round 6
-    # We need a working copy of the bracket slots
-    slots = list(bracket.slots)  # shallow copy is fine, Team objects are read-only here
-    results: dict[int, list[Team]] = {}
-
-    for round_num in range(1, 7):
-        round_winners = []
-        game_slots = bracket.get_all_game_slots_for_round(round_num)
-
-        for game_slot in game_slots:
-            left_slot, right_slot = bracket.get_matchup(game_slot)
-            team_a = slots[left_slot]
-            team_b = slots[right_slot]
+    if HAVE_NUMBA:
+        seed = int(rng.integers(2**31 - 1))
+        args = (bracket.slot_ids, win_probs, SLOT_ROUND.astype(np.int64), n_sims, seed)
+        if progress is not None:
+            return _run_sims_with_progress(args, n_sims, progress).T
+        return run_sims(*args, progress_counter(n_sims)).T
+
+    slots = np.empty((128, n_sims), dtype=bracket.slot_ids.dtype)
+    slots[:] = bracket.slot_ids[:, None]
+    draws = np.empty((63, n_sims), dtype=np.float32)
+    rng.random(out=draws, dtype=np.float32)
+    win_probs = win_probs.astype(np.float32)
+
+    for round_num, game_slots in ROUND_GAME_SLOTS.items():
+        _play_games_block(slots, draws, win_probs[round_num], game_slots[0], game_slots[-1] + 1)
+
+    if progress is not None:
+        progress.update(n_sims)
+    return slots
 
-            if team_a is None or team_b is None:
-                # Shouldn't happen in a complete bracket
-                winner = team_a or team_b
-            else:
-                p_a_wins = _game_win_prob(team_a, team_b, round_num)
-                winner = team_a if rng.random() < p_a_wins else team_b
 
-            slots[game_slot] = winner
-            round_winners.append(winner)
+def _run_sims_with_progress(args: tuple, n_sims: int, progress: tqdm) -> np.ndarray:
+    """Run ``run_sims`` on a helper thread, polling its sim counter into ``progress``."""
+    done = progress_counter(n_sims)
+    reported = 0
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(run_sims, *args, done)
+        while not wait([future], timeout=0.1).done:
+            finished = int(done.sum())
+            progress.update(finished - reported)
+            reported = finished
+        result = future.result()
+    progress.update(n_sims - reported)
+    return result
 
-        results[round_num] = round_winners
 
-    return results
+def simulate_many_flat(bracket: Bracket, rng: np.random.Generator, n_sims: int,
+                       win_probs: np.ndarray) -> list[list[Team | None]]:
+    """Simulate ``n_sims`` tournaments in bulk, as ``simulate_once_flat`` slot lists."""
+    teams = bracket.teams
+    return [
+        [teams[i] if i >= 0 else None for i in ids]
+        for ids in simulate_many_ids(bracket, rng, n_sims, win_probs).T.tolist()
+    ]
 
 
 def simulate_once_flat(bracket: Bracket, rng: np.random.Generator) -> list[Team | None]:
@@ -102,9 +311,8 @@ def simulate_once_flat(bracket: Bracket, rng: np.random.Generator) -> list[Team
     """
     slots = list(bracket.slots)
 
-    for round_num in range(1, 7):
-        for game_slot in bracket.get_all_game_slots_for_round(round_num):
-            left_slot, right_slot = bracket.get_matchup(game_slot)
+    for round_num, matchups in ROUND_MATCHUPS.items():
+        for game_slot, left_slot, right_slot in matchups:
             team_a = slots[left_slot]
             team_b = slots[right_slot]
 
@@ -117,6 +325,37 @@ def simulate_once_flat(bracket: Bracket, rng: np.random.Generator) -> list[Team
     return slots
 
 
+def build_win_prob_table(bracket: Bracket, log5_table: np.ndarray | None = None) -> np.ndarray:
+    """Tabulate ``_game_win_prob`` for every team pairing, by round.
+
+    Log5 odds come from one vectorized pass over the team ratings; only
+    pairings where both teams carry direct forecast odds are recomputed.
+
+    Args:
+        bracket: The 64-team bracket
+        log5_table: Optional precomputed ``log5_matrix`` of team ratings
+
+    Returns:
+        Array of shape (7, n_teams, n_teams) where ``[r, a, b]`` is the chance
+        team id ``a`` beats team id ``b`` in round ``r`` (ids index
+        ``bracket.teams``).
+    """
+    if log5_table is None:
+        log5_table = log5_matrix(bracket.ratings)
+    table = np.repeat(log5_table[None, :, :], 7, axis=0)
+
+    if any(getattr(team, "reach_probs", None) for team in bracket.teams):
+        for _, round_num, team_a, team_b in bracket.iter_possible_matchups():
+            direct_prob = _forecast_game_win_prob(team_a, team_b, round_num)
+            if direct_prob is None:
+                continue
+            a, b = bracket.team_id(team_a), bracket.team_id(team_b)
+            table[round_num, a, b] = direct_prob
+            table[round_num, b, a] = _forecast_game_win_prob(team_b, team_a, round_num)
+
+    return table
+
+
 def _game_win_prob(team_a: Team, team_b: Team, round_num: int) -> float:
     """Get a matchup win probability, preferring direct forecast odds when present."""
     direct_prob = _forecast_game_win_prob(team_a, team_b, round_num)
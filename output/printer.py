@@ -1,5 +1,7 @@
 """Pretty-print bracket output."""
 
+import sys
+
 from tabulate import tabulate
 
 import config
@@ -8,6 +10,11 @@ from models.team import Team
 from optimizer.pick_utils import default_pick_pct, get_pick_pct
 
 
+def team_labels(bracket: Bracket) -> dict[Team, str]:
+    """Display string (``str(team)``) of every team in ``bracket``, built once per printout."""
+    return {team: str(team) for team in bracket.teams}
+
+
 def print_bracket(bracket: Bracket, reach_probs: dict[str, dict[int, float]] | None = None):
     """Print the full bracket in a readable format.
 
@@ -15,107 +22,117 @@ def print_bracket(bracket: Bracket, reach_probs: dict[str, dict[int, float]] | N
         bracket: A filled bracket
         reach_probs: Optional probability data to show alongside picks
     """
-    print("\n" + "=" * 60)
-    print("           OPTIMIZED BRACKET")
-    print("=" * 60)
+    slots = bracket.slots
+    regions = bracket.regions
+    label = team_labels(bracket)
+    lines: list[str] = []
+    lines.append("\n" + "=" * 60)
+    lines.append("           OPTIMIZED BRACKET")
+    lines.append("=" * 60)
 
     # Print each region
     for region_idx in range(4):
-        region_name = bracket.regions.get(region_idx, f"Region {region_idx + 1}")
-        print(f"\n--- {region_name.upper()} REGION ---")
+        region_name = regions.get(region_idx, f"Region {region_idx + 1}")
+        lines.append(f"\n--- {region_name.upper()} REGION ---")
 
         # Round of 64 (round 1)
         base = 64 + region_idx * 16
         game_base = 32 + region_idx * 8
 
-        print(f"\n  Round of 64:")
+        lines.append(f"\n  Round of 64:")
         for i in range(8):
             game_slot = game_base + i
-            left = bracket.slots[base + 2 * i]
-            right = bracket.slots[base + 2 * i + 1]
-            winner = bracket.slots[game_slot]
+            left = slots[base + 2 * i]
+            right = slots[base + 2 * i + 1]
+            winner = slots[game_slot]
             if left and right and winner:
-                print(f"    {left} vs {right}  ->  {winner}")
+                lines.append(f"    {label[left]} vs {label[right]}  ->  {label[winner]}")
 
         # Round of 32 (round 2)
         r32_base = 16 + region_idx * 4
-        print(f"  Round of 32:")
+        lines.append(f"  Round of 32:")
         for i in range(4):
             game_slot = r32_base + i
-            winner = bracket.slots[game_slot]
+            winner = slots[game_slot]
             left_game = game_slot * 2
             right_game = game_slot * 2 + 1
-            team_a = bracket.slots[left_game]
-            team_b = bracket.slots[right_game]
+            team_a = slots[left_game]
+            team_b = slots[right_game]
             if team_a and team_b and winner:
-                print(f"    {team_a} vs {team_b}  ->  {winner}")
+                lines.append(f"    {label[team_a]} vs {label[team_b]}  ->  {label[winner]}")
 
         # Sweet 16 (round 3)
         s16_base = 8 + region_idx * 2
-        print(f"  Sweet 16:")
+        lines.append(f"  Sweet 16:")
         for i in range(2):
             game_slot = s16_base + i
-            winner = bracket.slots[game_slot]
-            team_a = bracket.slots[game_slot * 2]
-            team_b = bracket.slots[game_slot * 2 + 1]
+            winner = slots[game_slot]
+            team_a = slots[game_slot * 2]
+            team_b = slots[game_slot * 2 + 1]
             if team_a and team_b and winner:
-                print(f"    {team_a} vs {team_b}  ->  {winner}")
+                lines.append(f"    {label[team_a]} vs {label[team_b]}  ->  {label[winner]}")
 
         # Elite 8 (round 4) = regional final
         e8_slot = 4 + region_idx
-        e8_winner = bracket.slots[e8_slot]
-        team_a = bracket.slots[e8_slot * 2]
-        team_b = bracket.slots[e8_slot * 2 + 1]
+        e8_winner = slots[e8_slot]
+        team_a = slots[e8_slot * 2]
+        team_b = slots[e8_slot * 2 + 1]
         if team_a and team_b and e8_winner:
-            print(f"  Elite Eight:")
-            print(f"    {team_a} vs {team_b}  ->  {e8_winner}")
+            lines.append(f"  Elite Eight:")
+            lines.append(f"    {label[team_a]} vs {label[team_b]}  ->  {label[e8_winner]}")
 
     # Final Four
-    print(f"\n{'=' * 60}")
-    print("           FINAL FOUR")
-    print("=" * 60)
+    lines.append(f"\n{'=' * 60}")
+    lines.append("           FINAL FOUR")
+    lines.append("=" * 60)
 
     # Semifinal 1 (slot 2): region 0 winner vs region 1 winner
-    sf1_a = bracket.slots[4]
-    sf1_b = bracket.slots[5]
-    sf1_winner = bracket.slots[2]
+    sf1_a = slots[4]
+    sf1_b = slots[5]
+    sf1_winner = slots[2]
     if sf1_a and sf1_b and sf1_winner:
-        print(f"\n  Semifinal 1: {sf1_a} vs {sf1_b}  ->  {sf1_winner}")
+        lines.append(f"\n  Semifinal 1: {label[sf1_a]} vs {label[sf1_b]}  ->  {label[sf1_winner]}")
 
     # Semifinal 2 (slot 3): region 2 winner vs region 3 winner
-    sf2_a = bracket.slots[6]
-    sf2_b = bracket.slots[7]
-    sf2_winner = bracket.slots[3]
+    sf2_a = slots[6]
+    sf2_b = slots[7]
+    sf2_winner = slots[3]
     if sf2_a and sf2_b and sf2_winner:
-        print(f"  Semifinal 2: {sf2_a} vs {sf2_b}  ->  {sf2_winner}")
+        lines.append(f"  Semifinal 2: {label[sf2_a]} vs {label[sf2_b]}  ->  {label[sf2_winner]}")
 
     # Championship (slot 1)
-    champ_a = bracket.slots[2]
-    champ_b = bracket.slots[3]
-    champion = bracket.slots[1]
+    champ_a = slots[2]
+    champ_b = slots[3]
+    champion = slots[1]
     if champ_a and champ_b and champion:
-        print(f"\n  CHAMPIONSHIP: {champ_a} vs {champ_b}")
-        print(f"  CHAMPION: {champion}")
+        lines.append(f"\n  CHAMPIONSHIP: {label[champ_a]} vs {label[champ_b]}")
+        lines.append(f"  CHAMPION: {label[champion]}")
 
-    print("\n" + "=" * 60)
+    lines.append("\n" + "=" * 60)
 
     # Summary stats
     if reach_probs and champion:
         p_champ = reach_probs.get(champion.name, {}).get(7, 0)
-        print(f"  Champion win probability: {p_champ:.1%}")
+        lines.append(f"  Champion win probability: {p_champ:.1%}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_summary_table(bracket: Bracket, reach_probs: dict[str, dict[int, float]],
                         pick_pcts: dict[str, dict[int, float]] | None = None):
     """Print a summary table of key picks with probabilities and leverage."""
-    print("\n=== KEY PICKS SUMMARY ===\n")
+    slots = bracket.slots
+    regions = bracket.regions
+    label = team_labels(bracket)
+    lines: list[str] = []
+    lines.append("\n=== KEY PICKS SUMMARY ===\n")
 
     rows = []
 
     has_pick_data = bool(pick_pcts)
 
     # Champion
-    champion = bracket.slots[1]
+    champion = slots[1]
     if champion:
         p = reach_probs.get(champion.name, {}).get(7, 0)
         pp = 0
@@ -123,11 +140,11 @@ def print_summary_table(bracket: Bracket, reach_probs: dict[str, dict[int, float
             pp = get_pick_pct(pick_pcts or {}, champion.name, 7, default_pick_pct(champion.seed, 7))
         pp_str = f"{pp:.1%}" if has_pick_data else "N/A"
         leverage_str = f"{p / pp:.1f}x" if pp > 0 else ("N/A" if not has_pick_data else "unique")
-        rows.append(["Champion", str(champion), f"{p:.1%}", pp_str, leverage_str])
+        rows.append(["Champion", label[champion], f"{p:.1%}", pp_str, leverage_str])
 
     # Final Four
     for slot in [4, 5, 6, 7]:
-        team = bracket.slots[slot]
+        team = slots[slot]
         if team:
             p = reach_probs.get(team.name, {}).get(5, 0)
             pp = 0
@@ -135,8 +152,10 @@ def print_summary_table(bracket: Bracket, reach_probs: dict[str, dict[int, float
                 pp = get_pick_pct(pick_pcts or {}, team.name, 5, default_pick_pct(team.seed, 5))
             pp_str = f"{pp:.1%}" if has_pick_data else "N/A"
             leverage_str = f"{p / pp:.1f}x" if pp > 0 else ("N/A" if not has_pick_data else "unique")
-            region = bracket.regions.get(slot - 4, "?")
-            rows.append([f"F4 ({region})", str(team), f"{p:.1%}", pp_str, leverage_str])
+            region = regions.get(slot - 4, "?")
+            rows.append([f"F4 ({region})", label[team], f"{p:.1%}", pp_str, leverage_str])
 
     headers = ["Pick", "Team", "P(reach)", "Public %", "Leverage"]
-    print(tabulate(rows, headers=headers, tablefmt="simple"))
+    lines.append(tabulate(rows, headers=headers, tablefmt="simple"))
+
+    sys.stdout.write("\n".join(lines) + "\n")
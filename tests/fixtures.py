@@ -0,0 +1,17 @@
+"""Small synthetic brackets shared by the tests."""
+
+from models.bracket import Bracket
+from models.team import Team
+
+REGIONS = ["East", "West", "South", "Midwest"]
+
+
+def make_bracket() -> Bracket:
+    """A full 64-team bracket whose ratings fall off with seed."""
+    bracket = Bracket()
+    for region_idx, region in enumerate(REGIONS):
+        bracket.set_teams_for_region(region_idx, region, {
+            seed: Team(name=f"{region} {seed}", seed=seed, region=region, rating=0.95 - seed / 40)
+            for seed in range(1, 17)
+        })
+    return bracket
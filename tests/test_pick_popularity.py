@@ -0,0 +1,55 @@
+import unittest
+
+from ingestion import pick_popularity
+
+ROUND_HEADERS = ["R32 %", "Sweet 16 %", "Elite 8 %", "Final Four %", "Final %", "Champion %"]
+PCTS = [90, 60, 40, 20, 10, 5]
+
+
+def _page(headers, rows):
+    header = "".join(f"<th>{text}</th>" for text in headers)
+    body = "".join("<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>" for row in rows)
+    return f"<table><tr>{header}</tr>{body}</table>"
+
+
+def _resolver(name):
+    return {"St. Mary's": "Saint Mary's"}.get(name, name)
+
+
+class PickRowsRegexTest(unittest.TestCase):
+    def test_full_field_matches_table_parser(self):
+        names = ["St. Mary&#39;s"] + [f"Team {i}" for i in range(63)]
+        html = _page(["Team"] + ROUND_HEADERS,
+                     [[f'<a href="#">{name}</a>'] + [f"{pct}%" for pct in PCTS] for name in names])
+
+        picks = pick_popularity._parse_pick_rows_regex(html, _resolver)
+
+        self.assertEqual(len(picks), 64)
+        self.assertAlmostEqual(picks["Saint Mary's"][2], 0.9)
+        self.assertAlmostEqual(picks["Saint Mary's"][7], 0.05)
+        self.assertEqual(picks, pick_popularity._parse_multi_round_pick_table_html(html, _resolver))
+
+    def test_columns_follow_the_header(self):
+        # A leading seed column and a trailing non-round "%" cell must not
+        # shift the rounds.
+        headers = ["Seed", "Team"] + ROUND_HEADERS + ["Trend"]
+        html = _page(headers, [[str(i % 16 + 1), f"Team {i}"] + [f"{pct}%" for pct in PCTS] + ["+3%"]
+                               for i in range(64)])
+
+        picks = pick_popularity._parse_pick_rows_regex(html, _resolver)
+
+        self.assertEqual(len(picks), 64)
+        self.assertEqual(picks["Team 0"], {2: 0.9, 3: 0.6, 4: 0.4, 5: 0.2, 6: 0.1, 7: 0.05})
+
+    def test_partial_table_falls_back_to_table_parsers(self):
+        html = _page(["Team"] + ROUND_HEADERS,
+                     [[name] + [f"{pct}%" for pct in PCTS] for name in ("Duke", "Houston", "Auburn")])
+
+        self.assertEqual(pick_popularity._parse_pick_rows_regex(html, _resolver), {})
+        picks = pick_popularity._parse_espn_picks(html, _resolver)
+        self.assertEqual(set(picks), {"Duke", "Houston", "Auburn"})
+        self.assertAlmostEqual(picks["Duke"][7], 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
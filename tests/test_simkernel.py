@@ -0,0 +1,54 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from models.bracket import SLOT_ROUND
+from optimizer import simulator
+from optimizer._simkernel import SIM_BLOCK, progress_counter, run_sims
+from optimizer.simulator import build_win_prob_table
+from tests.fixtures import make_bracket
+
+
+class RunSimsTest(unittest.TestCase):
+    def setUp(self):
+        self.bracket = make_bracket()
+        self.win_probs = build_win_prob_table(self.bracket)
+        self.n_sims = 2 * SIM_BLOCK + 17
+
+    def _run(self, seed, progress=None):
+        if progress is None:
+            progress = progress_counter(self.n_sims)
+        return run_sims(self.bracket.slot_ids, self.win_probs, SLOT_ROUND.astype(np.int64),
+                        self.n_sims, seed, progress)
+
+    def test_same_seed_same_tournaments(self):
+        np.testing.assert_array_equal(self._run(7), self._run(7))
+        self.assertFalse(np.array_equal(self._run(7), self._run(8)))
+
+    def test_progress_counts_every_sim(self):
+        progress = progress_counter(self.n_sims)
+        self.assertEqual(len(progress), 3)
+        out = self._run(7, progress)
+        self.assertEqual(int(progress.sum()), self.n_sims)
+        self.assertTrue((out[:, 1:64] >= 0).all())
+        self.assertTrue((out[:, 0] == -1).all())
+
+
+class KernelBackendTest(unittest.TestCase):
+    def _simulate(self, compiled, seed):
+        with mock.patch.object(simulator, "HAVE_NUMBA", compiled):
+            return simulator.simulate_tournament(make_bracket(), 4000, seed=seed, show_progress=False, n_workers=1)
+
+    def test_kernel_is_reproducible_and_agrees_with_numpy(self):
+        compiled = self._simulate(True, 5)
+        self.assertEqual(compiled, self._simulate(True, 5))
+
+        numpy_path = self._simulate(False, 5)
+        for name, rounds in numpy_path.items():
+            for round_num, p in rounds.items():
+                self.assertAlmostEqual(compiled[name][round_num], p, delta=0.04)
+
+
+if __name__ == "__main__":
+    unittest.main()
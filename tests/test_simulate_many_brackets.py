@@ -0,0 +1,47 @@
+import dataclasses
+import unittest
+from unittest import mock
+
+from models.bracket import Bracket
+from optimizer import simulator
+from optimizer.simulator import simulate_many_brackets, simulate_tournament
+from tests.fixtures import make_bracket
+
+
+def _rerated(bracket: Bracket, region_idx: int, delta: float) -> Bracket:
+    """Same teams, but every team in one region rated ``delta`` higher."""
+    new = Bracket()
+    for slot in range(64, 128):
+        team = bracket.slots[slot]
+        if (slot - 64) // 16 == region_idx:
+            team = dataclasses.replace(team, rating=team.rating + delta)
+        new.set_team((slot - 64) // 16, (slot - 64) % 16, team)
+    new.regions = dict(bracket.regions)
+    return new
+
+
+class SimulateManyBracketsTest(unittest.TestCase):
+    def test_single_bracket_matches_simulate_tournament(self):
+        bracket = make_bracket()
+        expected = simulate_tournament(bracket, 3000, seed=3, show_progress=False, n_workers=1)
+        self.assertEqual(simulate_many_brackets([bracket], 3000, seed=3)[0], expected)
+
+    def test_chunked_sims_match_simulate_tournament(self):
+        bracket = make_bracket()
+        with mock.patch.object(simulator.config, "SIM_CHUNK", 1000):
+            expected = simulate_tournament(bracket, 2500, seed=3, show_progress=False, n_workers=1)
+            self.assertEqual(simulate_many_brackets([bracket], 2500, seed=3)[0], expected)
+
+    def test_equal_teams_with_new_ratings_are_not_reused(self):
+        base = make_bracket()
+        rerated = _rerated(base, 0, -0.3)
+        self.assertEqual(base.slots[64:80], rerated.slots[64:80])  # Team equality ignores rating
+
+        together = simulate_many_brackets([base, rerated], 3000, seed=3)
+        alone = simulate_many_brackets([rerated], 3000, seed=3)[0]
+        self.assertEqual(together[1], alone)
+        self.assertNotEqual(together[0], together[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
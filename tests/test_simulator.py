@@ -0,0 +1,53 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from optimizer import simulator
+from optimizer.simulator import build_win_prob_table
+from tests.fixtures import make_bracket
+
+
+class RecordingProgress:
+    """Stands in for a tqdm bar; remembers every update."""
+
+    def __init__(self):
+        self.updates = []
+
+    def update(self, n):
+        self.updates.append(n)
+
+
+class KernelProgressTest(unittest.TestCase):
+    def test_kernel_counter_drives_progress(self):
+        bracket = make_bracket()
+        win_probs = build_win_prob_table(bracket)
+        counters = []
+        kernel = simulator.run_sims
+
+        def run_sims(*args):
+            result = kernel(*args)
+            counters.append(args[-1].copy())
+            return result
+
+        progress = RecordingProgress()
+        n_sims = 3000
+        with mock.patch.object(simulator, "HAVE_NUMBA", True), \
+                mock.patch.object(simulator, "run_sims", run_sims):
+            with mock.patch.object(simulator.config, "SIM_CHUNK", 1000):
+                counts = simulator._simulate_counts(bracket, np.random.default_rng(1), n_sims, win_probs, progress)
+
+        self.assertEqual(len(counters), 3)
+        self.assertTrue(all(int(c.sum()) == 1000 for c in counters))
+        self.assertEqual(sum(progress.updates), n_sims)
+        self.assertEqual(int(counts[:, 7].sum()), n_sims)  # one champion per sim
+
+    def test_numpy_path_advances_progress(self):
+        bracket = make_bracket()
+        progress = RecordingProgress()
+        simulator.simulate_many_ids(bracket, np.random.default_rng(1), 500, build_win_prob_table(bracket), progress)
+        self.assertEqual(progress.updates, [500])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import cli
+from tests.fixtures import make_bracket
+
+
+class StateRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        state_dir = os.path.join(self.data_dir, "state")
+        patches = {
+            "STATE_DIR": state_dir,
+            "LEGACY_STATE_FILE": os.path.join(self.data_dir, "state.pkl"),
+            "META_STATE_FILE": os.path.join(state_dir, "meta.json"),
+        }
+        for name, value in patches.items():
+            patcher = mock.patch.object(cli, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.data_dir)
+
+    def _state_files(self):
+        return sorted(os.listdir(cli.STATE_DIR))
+
+    def test_round_trip_splits_tables_from_pickled_objects(self):
+        bracket = make_bracket()
+        cli.save_state({
+            "ratings": {"Duke": {"rating": 0.9}},
+            "pick_pcts": {"Duke": {2: 0.95, 7: 0.2}},
+            "reach_probs": {"Duke": {1: 1.0, 2: 0.97}},
+            "bracket": bracket,
+            "ratings_source": "torvik",
+        })
+
+        self.assertEqual(self._state_files(), [
+            "bracket.pkl", "meta.json", "pick_pcts.msgpack", "ratings.msgpack", "reach_probs.msgpack",
+        ])
+        state = cli.load_state()
+        self.assertEqual(state["ratings"], {"Duke": {"rating": 0.9}})
+        self.assertEqual(state["pick_pcts"], {"Duke": {2: 0.95, 7: 0.2}})
+        self.assertEqual(state["reach_probs"], {"Duke": {1: 1.0, 2: 0.97}})
+        self.assertEqual(state["ratings_source"], "torvik")
+        self.assertEqual(state["bracket"].teams, bracket.teams)
+        self.assertFalse(state.dirty_keys)
+
+    def test_popped_keys_lose_their_files(self):
+        cli.save_state({"ratings": {"Duke": {"rating": 0.9}}, "bracket": make_bracket()})
+        state = cli.load_state()
+        state.pop("bracket")
+        cli.save_state(state)
+
+        self.assertNotIn("bracket", cli.load_state())
+        self.assertNotIn("bracket.pkl", self._state_files())
+
+    def test_legacy_pickle_is_loaded_and_migrated(self):
+        legacy = {"ratings": {"Duke": {"rating": 0.9}}, "pick_pcts": {"Duke": {2: 0.95}}, "ratings_source": "torvik"}
+        with open(cli.LEGACY_STATE_FILE, "wb") as f:
+            pickle.dump(legacy, f)
+
+        state = cli.load_state()
+        self.assertEqual(dict(state), legacy)
+        self.assertEqual(state.dirty_keys, set(legacy))
+
+        cli.save_state(state)
+        self.assertEqual(self._state_files(), ["meta.json", "pick_pcts.msgpack", "ratings.msgpack"])
+        self.assertEqual(dict(cli.load_state()), legacy)
+
+    def test_corrupt_legacy_pickle_is_discarded(self):
+        with open(cli.LEGACY_STATE_FILE, "wb") as f:
+            f.write(b"not a pickle")
+
+        self.assertEqual(cli.load_state(), {})
+        self.assertFalse(os.path.exists(cli.LEGACY_STATE_FILE))
+
+    def test_numpy_scalars_are_saved_as_msgpack(self):
+        cli.save_state({
+            "ratings": {"Duke": {"rating": np.float32(0.5), "games": np.int64(30)}},
+            "pick_pcts": {"Duke": {np.int64(2): np.float64(0.75)}},
+        })
+
+        state = cli.load_state()
+        self.assertEqual(state["ratings"], {"Duke": {"rating": 0.5, "games": 30}})
+        self.assertEqual(state["pick_pcts"], {"Duke": {2: 0.75}})
+        self.assertTrue(os.path.exists(os.path.join(cli.STATE_DIR, "ratings.msgpack")))
+
+    def test_unpackable_value_falls_back_to_pickle(self):
+        ratings = {"Duke": {"rating": 0.9, "aliases": frozenset({"Duke Blue Devils"})}}
+        cli.save_state({"ratings": ratings})
+
+        self.assertEqual(cli.load_state()["ratings"], ratings)
+        self.assertFalse(os.path.exists(os.path.join(cli.STATE_DIR, "ratings.msgpack")))
+
+        cli.save_state({"ratings": {"Duke": {"rating": 0.9}}})
+        self.assertEqual(cli.load_state()["ratings"], {"Duke": {"rating": 0.9}})
+        self.assertFalse(os.path.exists(os.path.join(cli.STATE_DIR, "ratings.pkl")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from optimizer import engine
+from optimizer.simulator import simulate_once_flat
+from tests.fixtures import make_bracket
+
+
+class ValidateBackendsTest(unittest.TestCase):
+    def setUp(self):
+        self.bracket = make_bracket()
+        picks = self.bracket.copy()
+        for slot, team in enumerate(simulate_once_flat(self.bracket, np.random.default_rng(0))):
+            if 1 <= slot < 64:
+                picks.slots[slot] = team
+        picks.slot_ids = picks.ids_of(picks.slots)
+        self.picks = picks
+
+    def _validate(self, compiled, **kwargs):
+        with mock.patch.object(engine, "HAVE_NUMBA", compiled):
+            return engine._validate(self.picks, self.bracket, {}, 5, 400, np.random.default_rng(9),
+                                    quiet=True, **kwargs)
+
+    def test_compiled_and_python_paths_agree(self):
+        # Without Numba installed the kernel runs as plain Python, which is
+        # enough to check that both paths score the same sims and opponents.
+        for kwargs in ({}, {"upset_mode": "multiplier", "upset_values": {1: 1, 2: 1, 3: 2, 4: 2, 5: 3, 6: 3}}):
+            python_rate, python_score = self._validate(False, **kwargs)
+            compiled_rate, compiled_score = self._validate(True, **kwargs)
+            self.assertAlmostEqual(python_rate, compiled_rate)
+            self.assertAlmostEqual(python_score, compiled_score)
+
+    def test_compiled_path_reports_progress_per_chunk(self):
+        updates = []
+
+        class RecordingBar:
+            def __init__(self, total, disable, **kwargs):
+                self.disable = disable
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def update(self, n):
+                if not self.disable:
+                    updates.append(n)
+
+        with mock.patch.object(engine, "HAVE_NUMBA", True), \
+                mock.patch.object(engine, "tqdm", RecordingBar), \
+                mock.patch.object(engine.config, "VALIDATION_CHUNK", 150):
+            chunked = engine._validate(self.picks, self.bracket, {}, 5, 400, np.random.default_rng(9))
+        self.assertEqual(updates, [150, 150, 100])
+        self.assertEqual(chunked, self._validate(True))
+
+    def test_solo_pool_always_wins(self):
+        with mock.patch.object(engine, "HAVE_NUMBA", True):
+            rate, _ = engine._validate(self.picks, self.bracket, {}, 1, 50, np.random.default_rng(9), quiet=True)
+        self.assertEqual(rate, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+
+import config
+from models.bracket import SLOT_ROUND
+from optimizer._validate_kernel import UPSET_MULTIPLIER, UPSET_NONE, _fill_bracket, _score, validate_kernel
+from optimizer.scorer import score_pick_ids
+from optimizer.simulator import build_win_prob_table
+from tests.fixtures import make_bracket
+
+UPSET_VALUES = {1: 1, 2: 1, 3: 2, 4: 2, 5: 3, 6: 3}
+
+
+class ValidateKernelTest(unittest.TestCase):
+    def setUp(self):
+        self.bracket = make_bracket()
+        self.slot_round = SLOT_ROUND.astype(np.int64)
+        self.round_table = np.zeros(7)
+        for round_num, points in config.ROUND_POINTS.items():
+            self.round_table[round_num] = points
+        self.upset_table = np.zeros(7)
+        for round_num, value in UPSET_VALUES.items():
+            self.upset_table[round_num] = value
+
+        win_probs = build_win_prob_table(self.bracket)
+        np.random.seed(4)
+        self.rows = np.empty((6, 128), dtype=np.int8)
+        for row in self.rows:
+            row[0] = -1
+            _fill_bracket(self.bracket.slot_ids, win_probs, self.slot_round, row)
+
+    def _score(self, picks, actual, mode=UPSET_NONE):
+        return _score(picks, actual, self.slot_round, self.round_table, self.bracket.seeds, mode, self.upset_table)
+
+    def test_filled_brackets_are_consistent(self):
+        for row in self.rows:
+            np.testing.assert_array_equal(row[64:], self.bracket.slot_ids[64:])
+            for slot in range(1, 64):
+                self.assertIn(row[slot], (row[2 * slot], row[2 * slot + 1]))
+
+    def test_score_matches_scorer(self):
+        teams = self.bracket.teams
+        picks, actual = self.rows[0], self.rows[1]
+        self.assertEqual(self._score(picks, actual), score_pick_ids(picks, actual, teams))
+        self.assertEqual(self._score(picks, actual, UPSET_MULTIPLIER),
+                         score_pick_ids(picks, actual, teams, upset_mode="multiplier", upset_values=UPSET_VALUES))
+        self.assertEqual(self._score(actual, actual), score_pick_ids(actual, actual, teams))
+
+    def test_ties_with_the_best_opponent_count_half(self):
+        picks, actual_rows = self.rows[0], self.rows[1:3]
+        self.assertFalse(np.array_equal(picks, actual_rows[1]))
+        # Sim 0's only opponent made the same picks (a tie); sim 1's picked every game right.
+        opp_pool = np.stack([picks, actual_rows[1]])
+        opp_draws = np.array([[0], [1]])
+
+        wins, total = validate_kernel(picks, actual_rows, opp_pool, opp_draws, self.slot_round,
+                                      self.round_table, self.bracket.seeds, UPSET_NONE, self.upset_table)
+
+        self.assertEqual(wins, 0.5)
+        self.assertEqual(total, self._score(picks, actual_rows[0]) + self._score(picks, actual_rows[1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
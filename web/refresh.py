@@ -35,7 +35,7 @@ def refresh_ratings(conn, source="torvik", year=2026):
     try:
         from ingestion.ratings_sources import fetch_ratings_from_source
 
-        ratings = fetch_ratings_from_source(source, year=year, save=False)
+        ratings = fetch_ratings_from_source(source, year=year, save=False, refresh=True)
 
         conn.execute(
             "INSERT INTO cached_ratings (source, year, data_json) VALUES (?, ?, ?)",
@@ -70,10 +70,11 @@ def refresh_picks(conn, source="yahoo", year=2026, game_key=None, challenge_id=N
                 ratings=ratings,
                 challenge_id=challenge_id,
                 bracket_teams=bracket_teams,
+                refresh=True,
             )
         elif source == "yahoo":
             from ingestion.pick_popularity import fetch_yahoo_picks
-            pick_pcts = fetch_yahoo_picks(year=year, game_key=game_key, ratings=ratings)
+            pick_pcts = fetch_yahoo_picks(year=year, game_key=game_key, ratings=ratings, refresh=True)
         elif source == "ncaa":
             from ingestion.pick_popularity import fetch_ncaa_picks
             pick_pcts = fetch_ncaa_picks(ratings=ratings)